@@ -3,6 +3,8 @@ Account monitor (coordinator).
 Orchestrates fetching account data from all exchanges that support it.
 """
 
+import asyncio
+import logging
 from datetime import datetime
 from typing import List, Type, Dict, Any
 
@@ -99,7 +101,11 @@ class AccountMonitor(BaseMonitor):
                 logger.debug("No accounts to monitor")
                 return
 
-            logger.debug(f"Monitoring {len(accounts)} account(s) across {len(set(a['exchange'] for a in accounts))} exchanges")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Monitoring %d account(s) across %d exchanges",
+                    len(accounts), len({a['exchange'] for a in accounts})
+                )
 
             # Fetch and store data for each account
             total_stored = 0
@@ -124,7 +130,7 @@ class AccountMonitor(BaseMonitor):
                         continue
 
                     # Store in database
-                    stored_count = await self._store_account_data(account_data, account)
+                    stored_count = await asyncio.to_thread(self._store_account_data, account_data, account)
                     total_stored += stored_count
 
                 except Exception as e:
@@ -136,7 +142,7 @@ class AccountMonitor(BaseMonitor):
         except Exception as e:
             logger.error(f"Error in account monitor: {e}", exc_info=True)
 
-    async def _store_account_data(self, account_data: Dict[str, Any], account: Dict[str, Any]) -> int:
+    def _store_account_data(self, account_data: Dict[str, Any], account: Dict[str, Any]) -> int:
         """
         Store account data in database.
 
@@ -148,10 +154,10 @@ class AccountMonitor(BaseMonitor):
             Number of metrics stored
         """
         db = get_db_session()
-        stored_count = 0
 
         try:
             timestamp = datetime.utcnow()
+            rows = []
             account_name = account['name']
             account_id = account['id']
             exchange = account['exchange']
@@ -161,33 +167,32 @@ class AccountMonitor(BaseMonitor):
 
             # Store account value
             if 'account_value' in account_data:
-                account_value_data = WebhookData(
-                    monitor_id=f'{id_prefix}_value',
-                    monitor_name=f'{account_name} 账户价值',
-                    value=account_data['account_value'],
-                    timestamp=timestamp
-                )
-                db.add(account_value_data)
-                stored_count += 1
+                rows.append({
+                    'monitor_id': f'{id_prefix}_value',
+                    'monitor_name': f'{account_name} 账户价值',
+                    'value': account_data['account_value'],
+                    'timestamp': timestamp
+                })
 
                 logger.info(f"[{exchange}] {account_name} Account Value: ${account_data['account_value']:,.2f}")
 
             # Store each position
             if 'positions' in account_data:
                 for symbol, size in account_data['positions'].items():
-                    position_data = WebhookData(
-                        monitor_id=f'{id_prefix}_position_{symbol}',
-                        monitor_name=f'{account_name} {symbol} 持仓',
-                        value=size,
-                        timestamp=timestamp
-                    )
-                    db.add(position_data)
-                    stored_count += 1
+                    rows.append({
+                        'monitor_id': f'{id_prefix}_position_{symbol}',
+                        'monitor_name': f'{account_name} {symbol} 持仓',
+                        'value': size,
+                        'timestamp': timestamp
+                    })
 
-                    logger.debug(f"[{exchange}] {account_name} {symbol} Position: {size:+.4f}")
+                    logger.debug("[%s] %s %s Position: %+.4f", exchange, account_name, symbol, size)
 
+            # Core executemany INSERT; bypasses the ORM bulk-mapping layer
+            if rows:
+                db.execute(WebhookData.__table__.insert(), rows)
             db.commit()
-            return stored_count
+            return len(rows)
 
         except Exception as e:
             logger.error(f"[{account['exchange']}] Error storing account data for {account['name']}: {e}")
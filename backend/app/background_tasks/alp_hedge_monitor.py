@@ -6,14 +6,17 @@ Formula: hedge = (owned - locked + shortOI) / totalSupply × alpAmount
 """
 
 import asyncio
+import logging
 import struct
+import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import os
 
 from app.core.logger import get_logger
 from app.models.database import WebhookData, AppSetting, get_db_session
 from app.background_tasks.base import BaseMonitor
+from app.background_tasks.http_client import SOLANA_RPC_SEMAPHORE
 
 logger = get_logger(__name__)
 
@@ -23,6 +26,7 @@ ORACLE_ACCOUNT = "GEm9TZP7BL8rTz1JDy6X74PL595zr1putA9BXC8ehDmU"
 RPC_URL = "https://api.mainnet-beta.solana.com"
 ASSETS_OFFSET = 368
 SHORT_POSITION_OFFSET = 600
+SUPPLY_CACHE_TTL = 300  # ALP supply moves slowly; refresh every 5 minutes
 
 CUSTODY_ACCOUNTS = {
     "BONK": ("8aJuzsgjxBnvRhDcfQBD7z4CUj7QoPEpaNwVd7KqsSk5", 5),
@@ -38,6 +42,34 @@ ORACLE_SYMBOL_OFFSETS = {
     "WBTC": 248,
 }
 
+# Precompiled little-endian u64 layout (avoids re-parsing the format string)
+_U64 = struct.Struct('<Q')
+# Custody assets: owned and locked are adjacent u64s at ASSETS_OFFSET + 8
+_CUSTODY_ASSETS = struct.Struct('<QQ')
+
+
+def _build_oracle_price_struct():
+    """Build one struct that reads every oracle price, skipping the gaps between them."""
+    fields = sorted((offset - 32, symbol) for symbol, offset in ORACLE_SYMBOL_OFFSETS.items())
+    start = fields[0][0]
+    fmt = '<'
+    position = start
+    for price_offset, _ in fields:
+        fmt += f'{price_offset - position}xQ'
+        position = price_offset + 8
+    return start, [symbol for _, symbol in fields], struct.Struct(fmt)
+
+
+# Oracle prices (符号-32字节) unpacked in a single call
+_ORACLE_PRICES_START, _ORACLE_PRICE_SYMBOLS, _ORACLE_PRICES = _build_oracle_price_struct()
+
+
+def _account_buffer(data) -> memoryview:
+    """Zero-copy view over account data (solders already returns bytes)."""
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data)
+    return memoryview(data)
+
 
 class ALPHedgeMonitor(BaseMonitor):
     """Monitor for ALP hedge position calculations."""
@@ -45,16 +77,42 @@ class ALPHedgeMonitor(BaseMonitor):
     def __init__(self):
         # Run every 60 seconds (1 minute)
         super().__init__(name="ALP Hedge Calculator", interval=60)
+        # Account pubkeys are constant; decoded once on first use
+        self._alp_mint_pk = None
+        self._oracle_pk = None
+        self._custody_pks: Dict[str, Tuple[Any, int]] = {}
+        # (supply, monotonic expiry)
+        self._supply_cache: Optional[Tuple[float, float]] = None
+        self._solana_client = None
         logger.info("ALP Hedge Monitor initialized (reads ALP amount from database)")
 
+    async def stop(self) -> None:
+        """Stop the monitor and close the persistent RPC client."""
+        await super().stop()
+        if self._solana_client is not None:
+            await self._solana_client.close()
+            self._solana_client = None
+
+    def _load_pubkeys(self) -> None:
+        """Decode the ALP mint, oracle and custody addresses (once)."""
+        if self._alp_mint_pk is not None:
+            return
+
+        from solders.pubkey import Pubkey
+
+        self._oracle_pk = Pubkey.from_string(ORACLE_ACCOUNT)
+        self._custody_pks = {
+            symbol: (Pubkey.from_string(addr), decimals)
+            for symbol, (addr, decimals) in CUSTODY_ACCOUNTS.items()
+        }
+        self._alp_mint_pk = Pubkey.from_string(ALP_MINT)
+
     def _get_alp_amount(self) -> float:
         """Get ALP amount from database settings."""
         db = get_db_session()
         try:
-            setting = db.query(AppSetting).filter(AppSetting.key == "alp_amount").first()
-            if setting:
-                return float(setting.value)
-            return 0.0
+            value = db.query(AppSetting.value).filter(AppSetting.key == "alp_amount").scalar()
+            return float(value) if value else 0.0
         except Exception as e:
             logger.error(f"Error reading ALP amount from database: {e}")
             return 0.0
@@ -71,7 +129,8 @@ class ALPHedgeMonitor(BaseMonitor):
             logger.debug("ALP amount is 0, skipping hedge calculation")
             return
 
-        logger.debug(f"Calculating ALP hedge positions for {alp_amount:,.2f} ALP...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Calculating ALP hedge positions for {alp_amount:,.2f} ALP...")
 
         try:
             # Calculate hedge positions
@@ -82,7 +141,7 @@ class ALPHedgeMonitor(BaseMonitor):
                 return
 
             # Store data
-            stored_count = await self._store_hedge_data(hedge_positions)
+            stored_count = await asyncio.to_thread(self._store_hedge_data, hedge_positions)
             logger.info(f"Stored {stored_count} ALP hedge positions")
 
         except Exception as e:
@@ -90,29 +149,27 @@ class ALPHedgeMonitor(BaseMonitor):
 
     def _parse_u64(self, data: bytes, offset: int) -> int:
         """Parse little-endian u64"""
-        return struct.unpack('<Q', data[offset:offset+8])[0]
+        return _U64.unpack_from(data, offset)[0]
 
     async def _get_oracle_prices(self, client) -> Dict[str, float]:
         """Get prices from oracle account (符号-32字节, 除以1e10)"""
         try:
-            from solders.pubkey import Pubkey
-
-            oracle_pubkey = Pubkey.from_string(ORACLE_ACCOUNT)
-            response = await client.get_account_info(oracle_pubkey)
+            async with SOLANA_RPC_SEMAPHORE:
+                response = await client.get_account_info(self._oracle_pk)
 
             if not response.value or not response.value.data:
                 raise ValueError("Failed to get oracle data")
 
-            data = bytes(response.value.data)
+            data = _account_buffer(response.value.data)
 
             max_offset = max(ORACLE_SYMBOL_OFFSETS.values())
             if len(data) < max_offset + 8:
                 raise ValueError(f"Insufficient oracle data length: {len(data)}")
 
+            raw_prices = _ORACLE_PRICES.unpack_from(data, _ORACLE_PRICES_START)
+
             prices = {}
-            for symbol, symbol_offset in ORACLE_SYMBOL_OFFSETS.items():
-                price_offset = symbol_offset - 32  # 价格在符号-32字节处
-                raw_price = self._parse_u64(data, price_offset)
+            for symbol, raw_price in zip(_ORACLE_PRICE_SYMBOLS, raw_prices):
                 price = raw_price / 1e10
 
                 if price <= 0:
@@ -127,42 +184,42 @@ class ALPHedgeMonitor(BaseMonitor):
             raise
 
     async def _get_alp_supply(self, client) -> float:
-        """Get ALP total supply"""
-        try:
-            from solders.pubkey import Pubkey
+        """Get ALP total supply (cached for SUPPLY_CACHE_TTL seconds)"""
+        if self._supply_cache and time.monotonic() < self._supply_cache[1]:
+            return self._supply_cache[0]
 
-            mint = Pubkey.from_string(ALP_MINT)
-            response = await client.get_token_supply(mint)
+        try:
+            async with SOLANA_RPC_SEMAPHORE:
+                response = await client.get_token_supply(self._alp_mint_pk)
 
             if response.value:
                 amount = float(response.value.amount)
                 decimals = response.value.decimals
-                return amount / (10 ** decimals)
+                supply = amount / (10 ** decimals)
+                self._supply_cache = (supply, time.monotonic() + SUPPLY_CACHE_TTL)
+                return supply
 
             raise ValueError("Failed to get ALP supply")
         except Exception as e:
             logger.error(f"Error getting ALP supply: {e}")
             raise
 
-    async def _get_custody_data(self, client, custody_addr: str, decimals: int, price: float) -> Dict[str, float]:
+    async def _get_custody_data(self, client, custody_pubkey, decimals: int, price: float) -> Dict[str, float]:
         """Read custody account assets and short position data"""
         try:
-            from solders.pubkey import Pubkey
-
-            pubkey = Pubkey.from_string(custody_addr)
-            response = await client.get_account_info(pubkey)
+            async with SOLANA_RPC_SEMAPHORE:
+                response = await client.get_account_info(custody_pubkey)
 
             if not response.value or not response.value.data:
-                raise ValueError(f"Failed to get custody: {custody_addr}")
+                raise ValueError(f"Failed to get custody: {custody_pubkey}")
 
-            data = bytes(response.value.data)
+            data = _account_buffer(response.value.data)
 
             if len(data) < max(ASSETS_OFFSET + 24, SHORT_POSITION_OFFSET + 8):
                 raise ValueError(f"Insufficient custody data length: {len(data)}")
 
             # Read assets field
-            raw_owned = self._parse_u64(data, ASSETS_OFFSET + 8)
-            raw_locked = self._parse_u64(data, ASSETS_OFFSET + 16)
+            raw_owned, raw_locked = _CUSTODY_ASSETS.unpack_from(data, ASSETS_OFFSET + 8)
 
             if raw_locked > raw_owned:
                 raise ValueError("Invalid data: locked > owned")
@@ -182,7 +239,7 @@ class ALPHedgeMonitor(BaseMonitor):
                 "short_oi": short_oi,
             }
         except Exception as e:
-            logger.error(f"Error getting custody data for {custody_addr}: {e}")
+            logger.error(f"Error getting custody data for {custody_pubkey}: {e}")
             raise
 
     async def _calculate_hedge(self, alp_amount: float) -> Dict[str, Dict[str, float]]:
@@ -190,53 +247,53 @@ class ALPHedgeMonitor(BaseMonitor):
         try:
             from solana.rpc.async_api import AsyncClient
 
-            client = AsyncClient(RPC_URL)
+            self._load_pubkeys()
+            # Reuse one RPC client (and its keep-alive connection) across ticks
+            if self._solana_client is None:
+                self._solana_client = AsyncClient(RPC_URL)
+            client = self._solana_client
 
-            try:
-                # Get oracle prices first
-                prices = await self._get_oracle_prices(client)
+            # Get oracle prices first
+            prices = await self._get_oracle_prices(client)
 
-                # Get total supply
-                total_supply = await self._get_alp_supply(client)
+            # Get total supply
+            total_supply = await self._get_alp_supply(client)
 
-                if total_supply <= 0:
-                    raise ValueError(f"Invalid total supply: {total_supply}")
+            if total_supply <= 0:
+                raise ValueError(f"Invalid total supply: {total_supply}")
 
-                hedge_positions = {}
-                jitosol_to_sol_ratio = prices["JITOSOL"] / prices["SOL"]
+            hedge_positions = {}
+            jitosol_to_sol_ratio = prices["JITOSOL"] / prices["SOL"]
 
-                for symbol, (custody_addr, decimals) in CUSTODY_ACCOUNTS.items():
-                    price = prices.get(symbol)
-                    if not price:
-                        raise ValueError(f"No price for {symbol}")
+            for symbol, (custody_pubkey, decimals) in self._custody_pks.items():
+                price = prices.get(symbol)
+                if not price:
+                    raise ValueError(f"No price for {symbol}")
 
-                    data = await self._get_custody_data(client, custody_addr, decimals, price)
+                data = await self._get_custody_data(client, custody_pubkey, decimals, price)
 
-                    net_exposure = data["owned"] - data["locked"] + data["short_oi"]
-                    per_alp = net_exposure / total_supply
-                    hedge_amount = per_alp * alp_amount
+                net_exposure = data["owned"] - data["locked"] + data["short_oi"]
+                per_alp = net_exposure / total_supply
+                hedge_amount = per_alp * alp_amount
 
-                    # JITOSOL转换为SOL
-                    if symbol == "JITOSOL":
-                        sol_amount = hedge_amount * jitosol_to_sol_ratio
-                        if "SOL" in hedge_positions:
-                            hedge_positions["SOL"]["amount"] += sol_amount
-                            hedge_positions["SOL"]["per_alp"] += per_alp * jitosol_to_sol_ratio
-                        else:
-                            hedge_positions["SOL"] = {
-                                "amount": sol_amount,
-                                "per_alp": per_alp * jitosol_to_sol_ratio,
-                            }
+                # JITOSOL转换为SOL
+                if symbol == "JITOSOL":
+                    sol_amount = hedge_amount * jitosol_to_sol_ratio
+                    if "SOL" in hedge_positions:
+                        hedge_positions["SOL"]["amount"] += sol_amount
+                        hedge_positions["SOL"]["per_alp"] += per_alp * jitosol_to_sol_ratio
                     else:
-                        hedge_positions[symbol] = {
-                            "amount": hedge_amount,
-                            "per_alp": per_alp,
+                        hedge_positions["SOL"] = {
+                            "amount": sol_amount,
+                            "per_alp": per_alp * jitosol_to_sol_ratio,
                         }
+                else:
+                    hedge_positions[symbol] = {
+                        "amount": hedge_amount,
+                        "per_alp": per_alp,
+                    }
 
-                return hedge_positions
-
-            finally:
-                await client.close()
+            return hedge_positions
 
         except ImportError as e:
             logger.error(f"Missing required package: {e}. Install with: pip install solana solders")
@@ -245,32 +302,33 @@ class ALPHedgeMonitor(BaseMonitor):
             logger.error(f"Error calculating hedge positions: {e}", exc_info=True)
             return {}
 
-    async def _store_hedge_data(self, hedge_positions: Dict[str, Dict[str, float]]) -> int:
+    def _store_hedge_data(self, hedge_positions: Dict[str, Dict[str, float]]) -> int:
         """Store hedge position data in database."""
         db = get_db_session()
-        stored_count = 0
 
         try:
             timestamp = datetime.utcnow()
 
             # Store each hedge position
+            rows = []
             for symbol, data in hedge_positions.items():
                 # Use BTC instead of WBTC for display
                 display_symbol = "BTC" if symbol == "WBTC" else symbol
 
-                hedge_data = WebhookData(
-                    monitor_id=f'alp_hedge_{display_symbol}',
-                    monitor_name=f'ALP {display_symbol} 对冲量',
-                    value=data['amount'],
-                    timestamp=timestamp
-                )
-                db.add(hedge_data)
-                stored_count += 1
+                rows.append({
+                    "monitor_id": f'alp_hedge_{display_symbol}',
+                    "monitor_name": f'ALP {display_symbol} 对冲量',
+                    "value": data['amount'],
+                    "timestamp": timestamp
+                })
 
                 logger.info(f"ALP Hedge {display_symbol}: {data['amount']:+.8f} (per ALP: {data['per_alp']:.10f})")
 
+            # Core executemany INSERT; bypasses the ORM bulk-mapping layer
+            if rows:
+                db.execute(WebhookData.__table__.insert(), rows)
             db.commit()
-            return stored_count
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Error storing ALP hedge data: {e}")
@@ -4,6 +4,7 @@ Provides a common interface for background monitoring services.
 """
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -22,6 +23,9 @@ class BaseMonitor(ABC):
     3. Be stoppable via the stop() method
     """
 
+    # Set by the startup manager once the app has finished initializing
+    ready_event = asyncio.Event()
+
     def __init__(self, name: str, interval: int = 60):
         """
         Initialize monitor.
@@ -64,9 +68,13 @@ class BaseMonitor(ABC):
         Internal loop that runs the monitor.
         Handles initialization delay and error recovery.
         """
-        # Wait a bit before starting to let the app fully initialize
-        await asyncio.sleep(5)
+        # Wait for the app to finish initializing (at most 5 seconds)
+        try:
+            await asyncio.wait_for(BaseMonitor.ready_event.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            pass
 
+        deadline = time.monotonic()
         while self._running:
             try:
                 await self.run()
@@ -74,8 +82,14 @@ class BaseMonitor(ABC):
                 logger.error(f"Error in monitor '{self.name}': {e}", exc_info=True)
                 # Continue running despite errors
 
-            # Wait for next iteration
-            await asyncio.sleep(self.interval)
+            # Wait for next iteration, measured from the previous start so
+            # the time spent in run() doesn't push every later tick back
+            deadline += self.interval
+            now = time.monotonic()
+            if deadline < now:
+                # Overran the interval: run again now, don't burst to catch up
+                deadline = now
+            await asyncio.sleep(deadline - now)
 
     @abstractmethod
     async def run(self) -> None:
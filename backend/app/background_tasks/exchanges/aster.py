@@ -4,10 +4,11 @@ Handles funding rates from Aster.
 """
 
 import asyncio
-from datetime import datetime
 from typing import List, Dict, Any
 
-from .base import BaseExchangeAdapter
+import httpx
+
+from .base import BaseExchangeAdapter, FundingRateEntry
 
 
 class AsterAdapter(BaseExchangeAdapter):
@@ -25,7 +26,7 @@ class AsterAdapter(BaseExchangeAdapter):
     def __init__(self):
         super().__init__("aster")
 
-    async def fetch_funding_rates(self) -> List[Dict[str, Any]]:
+    async def fetch_funding_rates(self) -> List[FundingRateEntry]:
         """
         Fetch funding rates from Aster (new API format).
 
@@ -34,7 +35,7 @@ class AsterAdapter(BaseExchangeAdapter):
         - /fapi/v1/ticker/24hr for volume data
 
         Returns:
-            List of dicts with keys:
+            List of FundingRateEntry with fields:
             - symbol: str (e.g., "BTC", "ETH", "SOL")
             - rate: float (8-hour rate)
             - annualized_rate: float (APY percentage)
@@ -48,71 +49,60 @@ class AsterAdapter(BaseExchangeAdapter):
                 self._http_get(self.PREMIUM_URL),
                 self._http_get(self.TICKER_URL)
             )
-
-            # Build volume map from ticker data
-            volume_map = {}
-            for ticker in ticker_data:
-                symbol = ticker.get("symbol", "")
-                quote_volume = ticker.get("quoteVolume")  # USDT volume
-                if symbol and quote_volume:
-                    try:
-                        volume_map[symbol] = float(quote_volume)
-                    except (ValueError, TypeError):
-                        pass
-
-            rates = []
-            for entry in premium_data:
-                symbol = entry.get("symbol", "").upper()
-                if not symbol:
-                    continue
-
-                # Normalize symbol (remove USDT/USD suffix, Aster uses XxxxxUSDS/XxxxxUSD format)
-                normalized_symbol = symbol
-                if normalized_symbol.endswith("USDT"):
-                    normalized_symbol = normalized_symbol[:-4]
-                elif normalized_symbol.endswith("USD"):
-                    normalized_symbol = normalized_symbol[:-3]
-
-                # Get funding rate (lastFundingRate is the current 8h rate)
-                funding_rate = entry.get("lastFundingRate")
-                if funding_rate is None:
-                    continue
-
-                rate_8h = float(funding_rate)
-                annualized_rate = self.annualize_8h_rate(rate_8h)
-
-                # Get mark price
-                mark_price = entry.get("markPrice")
-                mark_price_value = float(mark_price) if mark_price else None
-
-                # Get next funding time (Unix timestamp in milliseconds)
-                next_funding_time_ms = entry.get("nextFundingTime")
-                next_funding_time = None
-                if next_funding_time_ms:
-                    try:
-                        next_funding_time = datetime.fromtimestamp(int(next_funding_time_ms) / 1000)
-                    except (ValueError, TypeError):
-                        pass
-
-                # Get volume from ticker map
-                turnover_24h = volume_map.get(symbol)
-
-                rates.append({
-                    "symbol": normalized_symbol,
-                    "rate": rate_8h,
-                    "annualized_rate": annualized_rate,
-                    "mark_price": mark_price_value,
-                    "next_funding_time": next_funding_time,
-                    "turnover_24h": turnover_24h  # For volume filtering
-                })
-
-            self.logger.debug(f"Fetched {len(rates)} funding rates")
-            return rates
-
-        except Exception as e:
+        except (httpx.HTTPError, ValueError) as e:
             self.logger.error(f"Error fetching funding rates: {e}")
             return []
 
+        if not isinstance(premium_data, list) or not isinstance(ticker_data, list):
+            self.logger.error("Unexpected Aster API response format")
+            return []
+
+        # Build volume map (USDT quote volume) from ticker data in one comprehension
+        parse_float = self.parse_float
+        volume_map = {
+            symbol: quote_volume
+            for ticker in ticker_data
+            if (symbol := ticker.get("symbol"))
+            and (quote_volume := parse_float(ticker.get("quoteVolume"))) is not None
+        }
+
+        # Keep entries with a symbol and a usable funding rate
+        # (lastFundingRate is the current 8h rate), then annualize them in one batch
+        rated_entries = []
+        raw_rates = []
+        for entry in premium_data:
+            # Aster returns uppercase symbols, matching the ticker keys as-is;
+            # normalize_symbol still uppercases the stored symbol
+            symbol = entry.get("symbol")
+            if not symbol:
+                continue
+            rate_8h = parse_float(entry.get("lastFundingRate"))
+            if rate_8h is not None:
+                rated_entries.append((symbol, entry))
+                raw_rates.append(rate_8h)
+        rates_8h, annualized_rates = self.annualize_8h_rates(raw_rates)
+
+        # Every rated entry yields a row, so build them in one comprehension.
+        # Per-row helpers are bound to locals once; this runs for every listed perp
+        parse_ms_timestamp = self.parse_ms_timestamp
+        normalize_symbol = self.normalize_symbol
+        get_volume = volume_map.get
+        rates = [
+            FundingRateEntry(
+                # Remove USDT/USD suffix (Aster uses XxxxxUSDT/XxxxxUSD format)
+                symbol=normalize_symbol(symbol),
+                rate=rate_8h,
+                annualized_rate=annualized_rate,
+                mark_price=parse_float(entry.get("markPrice")),
+                next_funding_time=parse_ms_timestamp(entry.get("nextFundingTime")),  # ms timestamp
+                turnover_24h=get_volume(symbol)  # For volume filtering
+            )
+            for (symbol, entry), rate_8h, annualized_rate in zip(rated_entries, rates_8h, annualized_rates)
+        ]
+
+        self.logger.debug("Fetched %d funding rates", len(rates))
+        return rates
+
     async def fetch_spot_prices(self) -> List[Dict[str, Any]]:
         """Aster doesn't provide spot prices."""
         return []
@@ -1,87 +1,148 @@
 """Backpack exchange adapter."""
 import asyncio
+import time
 from typing import List, Dict, Any
-from .base import BaseExchangeAdapter
+
+import httpx
+
+from .base import BaseExchangeAdapter, FundingRateEntry
 
 
 class BackpackAdapter(BaseExchangeAdapter):
     MARKETS_URL = "https://api.backpack.exchange/api/v1/markets"
     FUNDING_RATE_URL = "https://api.backpack.exchange/api/v1/fundingRates"
-    TICKER_URL = "https://api.backpack.exchange/api/v1/ticker"
+    TICKERS_URL = "https://api.backpack.exchange/api/v1/tickers"
+
+    # Funding history has no all-markets form, so it stays per symbol;
+    # cap how many of those requests are in flight at once
+    MAX_CONCURRENT_REQUESTS = 8
+
+    # Funding settles hourly and the latest rate is fixed until the next
+    # settlement, so per-symbol results are cached for the rest of the hour.
+    # Results fetched right after the hour may predate the new settlement
+    # and are not cached.
+    FUNDING_INTERVAL_SECONDS = 3600
+    FUNDING_PUBLISH_GRACE_SECONDS = 120
+
+    # Market listings rarely change; refresh the perp list hourly, not every poll
+    MARKETS_TTL_SECONDS = 3600
 
     def __init__(self):
         super().__init__("backpack")
+        # symbol -> latest hourly rate, valid until _funding_cache_expiry
+        self._funding_cache: Dict[str, float] = {}
+        self._funding_cache_expiry = 0.0
+
+    async def _fetch_perp_symbols(self) -> List[str]:
+        """List USDC perpetual market symbols."""
+        markets = await self._http_get(self.MARKETS_URL)
+        if not isinstance(markets, list):
+            self.logger.error("Unexpected Backpack markets response format")
+            return []
+
+        return [
+            m.get("symbol", "")
+            for m in markets
+            if m.get("symbol", "").endswith("_USDC_PERP")
+        ]
 
-    async def fetch_funding_rates(self) -> List[Dict[str, Any]]:
+    async def fetch_funding_rates(self) -> List[FundingRateEntry]:
         try:
-            # Get all markets first to find USDC perps
-            markets = await self._http_get(self.MARKETS_URL)
-
-            # Filter for USDC perpetuals
-            perp_symbols = [
-                m.get("symbol", "")
-                for m in markets
-                if m.get("symbol", "").endswith("_USDC_PERP")
-            ]
-
-            if not perp_symbols:
-                return []
-
-            # Fetch funding rates and tickers in parallel for all symbols
-            tasks = []
-            for symbol in perp_symbols:
-                tasks.append(self._http_get(
-                    self.FUNDING_RATE_URL,
-                    params={"symbol": symbol, "limit": 1}
-                ))
-                tasks.append(self._http_get(
-                    self.TICKER_URL,
-                    params={"symbol": symbol}
-                ))
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            rates = []
-            for i in range(0, len(results), 2):
-                symbol = perp_symbols[i // 2]
-                base_symbol = symbol.replace("_USDC_PERP", "")
-
-                # Get funding rate (latest entry)
-                funding_result = results[i]
-                if isinstance(funding_result, Exception) or not funding_result:
-                    continue
-
-                funding_rate_str = funding_result[0].get("fundingRate") if len(funding_result) > 0 else None
-                if funding_rate_str is None:
-                    continue
-
-                # Get volume from ticker
-                ticker_result = results[i + 1]
-                volume_24h = None
-                if not isinstance(ticker_result, Exception) and ticker_result:
-                    volume_str = ticker_result.get("quoteVolume")
-                    if volume_str:
-                        volume_24h = float(volume_str)
-
-                # Backpack uses 1-hour funding (they switched in Aug 2025)
-                rate_1h = float(funding_rate_str)
-                rate_8h = rate_1h * 8  # Normalize to 8h
-                annualized_rate = self.annualize_1h_rate(rate_1h)
-
-                rates.append({
-                    "symbol": base_symbol,
-                    "rate": rate_8h,
-                    "annualized_rate": annualized_rate,
-                    "mark_price": None,
-                    "next_funding_time": None,
-                    "turnover_24h": volume_24h  # For volume filtering
-                })
-
-            self.logger.debug(f"Fetched {len(rates)} funding rates")
-            return rates
-        except Exception as e:
+            # Get all markets first to find USDC perps (cached between polls)
+            perp_symbols = await self._get_cached(
+                "perp_symbols", self.MARKETS_TTL_SECONDS, self._fetch_perp_symbols
+            )
+        except (httpx.HTTPError, ValueError) as e:
             self.logger.error(f"Error: {e}")
             return []
+
+        if not perp_symbols:
+            return []
+
+        now = time.time()
+        if now >= self._funding_cache_expiry:
+            interval_start = now - now % self.FUNDING_INTERVAL_SECONDS
+            self._funding_cache = {}
+            self._funding_cache_expiry = interval_start + self.FUNDING_INTERVAL_SECONDS
+        cache_results = now % self.FUNDING_INTERVAL_SECONDS >= self.FUNDING_PUBLISH_GRACE_SECONDS
+
+        missing_symbols = [s for s in perp_symbols if s not in self._funding_cache]
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_tickers() -> Any:
+            try:
+                return await self._http_get(self.TICKERS_URL)
+            except (httpx.HTTPError, ValueError) as e:
+                self.logger.warning(f"Error fetching tickers: {e}")
+                return None
+
+        async def fetch_funding(symbol: str) -> Any:
+            async with semaphore:
+                try:
+                    return await self._http_get(
+                        self.FUNDING_RATE_URL,
+                        params={"symbol": symbol, "limit": 1}
+                    )
+                except (httpx.HTTPError, ValueError) as e:
+                    self.logger.debug(f"Error fetching funding for {symbol}: {e}")
+                    return None
+
+        # All tickers come back from one request; funding is per symbol
+        # and only for symbols not already cached this hour. Per-request
+        # failures resolve to None, so one bad symbol never cancels the rest.
+        async with asyncio.TaskGroup() as tg:
+            tickers_task = tg.create_task(fetch_tickers())
+            funding_tasks = [tg.create_task(fetch_funding(symbol)) for symbol in missing_symbols]
+        tickers = tickers_task.result()
+
+        fetched_rates = {}
+        for symbol, funding_task in zip(missing_symbols, funding_tasks):
+            # Latest entry; skip failed or empty lookups
+            funding_result = funding_task.result()
+            if not isinstance(funding_result, list) or not funding_result:
+                continue
+            rate_1h = self.parse_float(funding_result[0].get("fundingRate"))
+            if rate_1h is not None:
+                fetched_rates[symbol] = rate_1h
+
+        if cache_results:
+            self._funding_cache.update(fetched_rates)
+
+        ticker_map = {}
+        if isinstance(tickers, list):
+            ticker_map = {t.get("symbol"): t for t in tickers if isinstance(t, dict)}
+
+        rates = []
+        for symbol in perp_symbols:
+            # Keep the exchange's casing (e.g. "kBONK"); normalize_symbol would
+            # uppercase it and split the stored history for that pair
+            base_symbol = symbol.removesuffix("_USDC_PERP")
+
+            rate_1h = self._funding_cache.get(symbol, fetched_rates.get(symbol))
+            if rate_1h is None:
+                continue
+
+            # Get volume from ticker
+            ticker = ticker_map.get(symbol)
+            volume_24h = None
+            if ticker is not None:
+                volume_24h = self.parse_float(ticker.get("quoteVolume"))
+
+            # Backpack uses 1-hour funding (they switched in Aug 2025)
+            rate_8h = rate_1h * 8  # Normalize to 8h
+            annualized_rate = self.annualize_1h_rate(rate_1h)
+
+            rates.append(FundingRateEntry(
+                symbol=base_symbol,
+                rate=rate_8h,
+                annualized_rate=annualized_rate,
+                mark_price=None,
+                next_funding_time=None,
+                turnover_24h=volume_24h  # For volume filtering
+            ))
+
+        self.logger.debug("Fetched %d funding rates", len(rates))
+        return rates
     
     async def fetch_spot_prices(self) -> List[Dict[str, Any]]:
         return []
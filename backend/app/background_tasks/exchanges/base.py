@@ -3,11 +3,44 @@ Base class for exchange adapters.
 Provides common utilities for fetching data from exchanges.
 """
 
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
 from abc import ABC
-import httpx
+
+import numpy as np
+import orjson
 
 from app.core.logger import get_logger
+from app.background_tasks.http_client import get_shared_client
+
+
+@dataclass(slots=True)
+class FundingRateEntry:
+    """One funding rate row returned by fetch_funding_rates()."""
+    symbol: str
+    rate: float                                  # 8-hour rate (or 8h equivalent)
+    annualized_rate: float                       # Annualized rate in percentage
+    mark_price: Optional[float] = None
+    next_funding_time: Optional[datetime] = None
+    turnover_24h: Optional[float] = None         # Quote volume, for top-N filtering
+
+
+@lru_cache(maxsize=256)
+def _ms_to_datetime(ms: int) -> datetime:
+    """Convert a millisecond Unix timestamp to local datetime (memoized)."""
+    return datetime.fromtimestamp(ms / 1000)
+
+
+@lru_cache(maxsize=256)
+def _iso_to_datetime(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (memoized), or None if malformed."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
 
 
 class BaseExchangeAdapter(ABC):
@@ -15,12 +48,21 @@ class BaseExchangeAdapter(ABC):
     Base class for exchange data adapters.
 
     Each exchange adapter can implement:
-    - fetch_funding_rates() -> List[Dict]
+    - fetch_funding_rates() -> List[FundingRateEntry]
     - fetch_spot_prices() -> List[Dict]
     - fetch_account_data() -> Dict
     - etc.
     """
 
+    # Funding periods per year times 100 (percentage), folded once
+    ANNUALIZE_8H_FACTOR = 3 * 365 * 100
+    ANNUALIZE_1H_FACTOR = 24 * 365 * 100
+
+    # Quote/contract suffixes stripped by normalize_symbol, first match wins:
+    # each suffix precedes any shorter one it ends with (e.g. "_USDC_PERP"
+    # and "-PERP" before "PERP")
+    SYMBOL_SUFFIXES = ("_USDC_PERP", "USDT", "_PERP", "-PERP", "PERP", "USD")
+
     def __init__(self, exchange_name: str):
         """
         Initialize exchange adapter.
@@ -30,6 +72,37 @@ class BaseExchangeAdapter(ABC):
         """
         self.exchange_name = exchange_name.lower()
         self.logger = get_logger(f"{__name__}.{exchange_name}")
+        # key -> (monotonic expiry, value) for slow-changing reference data
+        self._ttl_cache: Dict[str, Tuple[float, Any]] = {}
+
+    async def _get_cached(self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached value, calling fetch() once it is older than ttl.
+
+        Meant for reference data (market/instrument lists) that changes far
+        less often than the poll interval. Empty results are not cached, so
+        a bad response is retried on the next call.
+
+        Args:
+            key: Cache key, unique within this adapter
+            ttl: Seconds to keep the value
+            fetch: Coroutine function producing the (already processed) value
+
+        Returns:
+            Cached or freshly fetched value
+
+        Raises:
+            Whatever fetch() raises; the previous entry is left untouched
+        """
+        now = time.monotonic()
+        cached = self._ttl_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        value = await fetch()
+        if value:
+            self._ttl_cache[key] = (now + ttl, value)
+        return value
 
     async def _http_get(
         self,
@@ -53,10 +126,10 @@ class BaseExchangeAdapter(ABC):
         Raises:
             httpx.HTTPError: On request failure
         """
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        client = get_shared_client()
+        response = await client.get(url, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def _http_post(
         self,
@@ -80,13 +153,13 @@ class BaseExchangeAdapter(ABC):
         Raises:
             httpx.HTTPError: On request failure
         """
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(url, json=json_data, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        client = get_shared_client()
+        response = await client.post(url, json=json_data, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
-    @staticmethod
-    def annualize_8h_rate(rate_8h: float) -> float:
+    @classmethod
+    def annualize_8h_rate(cls, rate_8h: float) -> float:
         """
         Convert 8-hour funding rate to annualized percentage.
 
@@ -96,10 +169,10 @@ class BaseExchangeAdapter(ABC):
         Returns:
             Annualized rate in percentage (e.g., 10.95%)
         """
-        return rate_8h * 3 * 365 * 100
+        return rate_8h * cls.ANNUALIZE_8H_FACTOR
 
-    @staticmethod
-    def annualize_1h_rate(rate_1h: float) -> float:
+    @classmethod
+    def annualize_1h_rate(cls, rate_1h: float) -> float:
         """
         Convert 1-hour funding rate to annualized percentage.
 
@@ -109,16 +182,118 @@ class BaseExchangeAdapter(ABC):
         Returns:
             Annualized rate in percentage
         """
-        return rate_1h * 24 * 365 * 100
+        return rate_1h * cls.ANNUALIZE_1H_FACTOR
+
+    @classmethod
+    def annualize_8h_rates(cls, raw_rates: List[Any]) -> Tuple[List[float], List[float]]:
+        """
+        Parse and annualize a batch of 8-hour funding rates in one pass.
+
+        Numeric strings are converted by NumPy in C rather than one
+        float() call per row.
+
+        Args:
+            raw_rates: 8-hour rates as numbers or numeric strings
+
+        Returns:
+            Tuple of (rates, annualized rates in percentage) as plain floats
+
+        Raises:
+            ValueError: If any rate is not numeric
+        """
+        rates = np.asarray(raw_rates, dtype=np.float64)
+        return rates.tolist(), (rates * cls.ANNUALIZE_8H_FACTOR).tolist()
+
+    @classmethod
+    def annualize_1h_rates(cls, raw_rates: List[Any]) -> Tuple[List[float], List[float]]:
+        """
+        Parse and annualize a batch of 1-hour funding rates in one pass.
+
+        Args:
+            raw_rates: 1-hour rates as numbers or numeric strings
+
+        Returns:
+            Tuple of (rates, annualized rates in percentage) as plain floats
+
+        Raises:
+            ValueError: If any rate is not numeric
+        """
+        rates = np.asarray(raw_rates, dtype=np.float64)
+        return rates.tolist(), (rates * cls.ANNUALIZE_1H_FACTOR).tolist()
 
     @staticmethod
-    def normalize_symbol(symbol: str) -> str:
+    def parse_float(value: Any) -> Optional[float]:
+        """
+        Convert a numeric API field (number or numeric string) to float.
+
+        Args:
+            value: Raw field value
+
+        Returns:
+            Float value, or None if the value is missing or malformed
+        """
+        # JSON numbers already decode to float/int; no parse or try frame needed
+        value_type = type(value)
+        if value_type is float:
+            return value
+        if value_type is int:
+            return float(value)
+        if value_type is not str or not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_ms_timestamp(value: Any) -> Optional[datetime]:
+        """
+        Convert a millisecond Unix timestamp to datetime.
+
+        Funding times repeat across every symbol on the same schedule, so
+        conversions are memoized and each distinct value is built once.
+
+        Args:
+            value: Timestamp as int, float or digit string (e.g., 1700000000000)
+
+        Returns:
+            Local datetime, or None if the value is missing or malformed
+        """
+        # bool is an int subclass, but True/False are never timestamps
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return _ms_to_datetime(int(value)) if value else None
+        if isinstance(value, str) and value.isdigit():
+            return _ms_to_datetime(int(value))
+        return None
+
+    @staticmethod
+    def parse_iso_timestamp(value: Any) -> Optional[datetime]:
+        """
+        Convert an ISO 8601 timestamp string to datetime.
+
+        Like parse_ms_timestamp, conversions are memoized because every
+        symbol shares the same few funding times.
+
+        Args:
+            value: Timestamp string (e.g., "2025-01-01T08:00:00Z")
+
+        Returns:
+            Datetime (timezone-aware if the string has an offset or "Z"),
+            or None if the value is missing or malformed
+        """
+        if isinstance(value, str) and value:
+            return _iso_to_datetime(value)
+        return None
+
+    @classmethod
+    def normalize_symbol(cls, symbol: str) -> str:
         """
         Normalize symbol to standard format (uppercase, no suffix).
 
         Examples:
             "BTCUSDT" -> "BTC"
             "btc-perp" -> "BTC"
+            "SOL_USDC_PERP" -> "SOL"
             "eth" -> "ETH"
 
         Args:
@@ -127,9 +302,15 @@ class BaseExchangeAdapter(ABC):
         Returns:
             Normalized symbol
         """
-        # Remove common suffixes
         symbol = symbol.upper()
-        for suffix in ["USDT", "USD", "PERP", "-PERP", "_PERP"]:
+        # Most perps are USDT-quoted: one slice compare settles the common case
+        # (no earlier suffix in SYMBOL_SUFFIXES can also end in "USDT")
+        if symbol[-4:] == "USDT":
+            return symbol[:-4]
+        # One C-level check rejects symbols without any known suffix
+        if not symbol.endswith(cls.SYMBOL_SUFFIXES):
+            return symbol
+        for suffix in cls.SYMBOL_SUFFIXES:
             if symbol.endswith(suffix):
-                symbol = symbol[:-len(suffix)]
+                return symbol.removesuffix(suffix)
         return symbol
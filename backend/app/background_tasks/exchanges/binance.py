@@ -3,10 +3,12 @@ Binance exchange adapter.
 Handles both funding rates and spot prices from Binance.
 """
 
-from datetime import datetime
+import asyncio
 from typing import List, Dict, Any, Optional
 
-from .base import BaseExchangeAdapter
+import httpx
+
+from .base import BaseExchangeAdapter, FundingRateEntry
 
 
 class BinanceAdapter(BaseExchangeAdapter):
@@ -22,22 +24,15 @@ class BinanceAdapter(BaseExchangeAdapter):
     FUNDING_API = "https://fapi.binance.com/fapi/v1/premiumIndex"
     SPOT_API = "https://api.binance.com/api/v3/ticker/24hr"
 
-    # Target symbols
-    FUNDING_SYMBOLS = {
-        "BTCUSDT": "BTC",
-        "ETHUSDT": "ETH",
-        "SOLUSDT": "SOL"
-    }
-
     def __init__(self):
         super().__init__("binance")
 
-    async def fetch_funding_rates(self) -> List[Dict[str, Any]]:
+    async def fetch_funding_rates(self) -> List[FundingRateEntry]:
         """
         Fetch funding rates from Binance Futures with volume data.
 
         Returns:
-            List of dicts with keys:
+            List of FundingRateEntry with fields:
             - symbol: str (normalized, e.g., "BTC")
             - rate: float (8-hour rate)
             - annualized_rate: float (APY percentage)
@@ -46,75 +41,60 @@ class BinanceAdapter(BaseExchangeAdapter):
             - turnover_24h: float (USDT volume for filtering)
         """
         try:
-            import asyncio
-
             # Fetch both funding rates and 24hr tickers in parallel
             funding_data, ticker_data = await asyncio.gather(
                 self._http_get(self.FUNDING_API),
                 self._http_get("https://fapi.binance.com/fapi/v1/ticker/24hr")
             )
+        except (httpx.HTTPError, ValueError) as e:
+            self.logger.error(f"Error fetching funding rates: {e}")
+            return []
 
-            # Build volume map from ticker data
-            volume_map = {}
-            for ticker in ticker_data:
-                symbol = ticker.get("symbol", "")
-                quote_volume = ticker.get("quoteVolume")  # USDT volume
-                if symbol and quote_volume:
-                    try:
-                        volume_map[symbol] = float(quote_volume)
-                    except (ValueError, TypeError):
-                        pass
-
-            rates = []
-            for item in funding_data:
-                symbol_pair = item.get("symbol", "")
-
-                # Only process USDT perpetual contracts
-                if not symbol_pair.endswith("USDT"):
-                    continue
-
-                # Extract base symbol (e.g., BTCUSDT -> BTC)
-                base_symbol = symbol_pair[:-4]
-
-                # Extract data
-                funding_rate_str = item.get("lastFundingRate")
-                mark_price_str = item.get("markPrice")
-                next_funding_time_ms = item.get("nextFundingTime")
-
-                if funding_rate_str is None:
-                    continue
-
-                # Parse values
-                rate_8h = float(funding_rate_str)
-                annualized_rate = self.annualize_8h_rate(rate_8h)
-                mark_price = float(mark_price_str) if mark_price_str else None
-
-                # Parse next funding time (milliseconds timestamp)
-                next_funding_time = None
-                if next_funding_time_ms:
-                    try:
-                        next_funding_time = datetime.fromtimestamp(int(next_funding_time_ms) / 1000)
-                    except (ValueError, TypeError):
-                        pass
-
-                # Get volume from ticker map
-                turnover_24h = volume_map.get(symbol_pair)
-
-                rates.append({
-                    "symbol": base_symbol,
-                    "rate": rate_8h,
-                    "annualized_rate": annualized_rate,
-                    "mark_price": mark_price,
-                    "next_funding_time": next_funding_time,
-                    "turnover_24h": turnover_24h  # For volume filtering
-                })
+        if not isinstance(funding_data, list) or not isinstance(ticker_data, list):
+            self.logger.error("Unexpected Binance API response format")
+            return []
 
-            self.logger.debug(f"Fetched {len(rates)} funding rates")
-            return rates
+        # Build volume map (USDT quote volume) from ticker data in one comprehension
+        parse_float = self.parse_float
+        volume_map = {
+            symbol: quote_volume
+            for ticker in ticker_data
+            if (symbol := ticker.get("symbol"))
+            and (quote_volume := parse_float(ticker.get("quoteVolume"))) is not None
+        }
+
+        # Keep USDT perpetuals with a usable rate, then annualize them in one batch.
+        # Both filters run in this single pass over the decoded payload, so no
+        # intermediate list of the ~500 raw items is built
+        rated_items = []
+        raw_rates = []
+        for item in funding_data:
+            if not item.get("symbol", "").endswith("USDT"):
+                continue
+            rate_8h = parse_float(item.get("lastFundingRate"))
+            if rate_8h is not None:
+                rated_items.append(item)
+                raw_rates.append(rate_8h)
+        rates_8h, annualized_rates = self.annualize_8h_rates(raw_rates)
+
+        # Every rated item yields a row, so build them in one comprehension.
+        # Per-row helpers are bound to locals once; this runs for every listed perp
+        parse_ms_timestamp = self.parse_ms_timestamp
+        get_volume = volume_map.get
+        rates = [
+            FundingRateEntry(
+                symbol=item["symbol"][:-4],  # BTCUSDT -> BTC
+                rate=rate_8h,
+                annualized_rate=annualized_rate,
+                mark_price=parse_float(item.get("markPrice")),
+                next_funding_time=parse_ms_timestamp(item.get("nextFundingTime")),  # ms timestamp
+                turnover_24h=get_volume(item["symbol"])  # For volume filtering
+            )
+            for item, rate_8h, annualized_rate in zip(rated_items, rates_8h, annualized_rates)
+        ]
 
-        except Exception as e:
-            self.logger.error(f"Error fetching funding rates: {e}")
-            return []
+        self.logger.debug("Fetched %d funding rates", len(rates))
+        return rates
 
     async def fetch_spot_prices(self, target_symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
@@ -131,32 +111,50 @@ class BinanceAdapter(BaseExchangeAdapter):
             - volume_24h: float
         """
         try:
-            data = await self._http_get(self.SPOT_API)
+            # Resolve wanted pairs up front so any unwanted tickers
+            # are rejected with a single dict lookup
+            wanted_pairs = {f"{s}USDT": s for s in target_symbols} if target_symbols else None
+
+            # MINI tickers omit bid/ask, weighted-average and price-change
+            # fields we never read, roughly halving the payload to decode
+            data = None
+            if wanted_pairs is not None:
+                # Ask for just the target pairs instead of all ~2000 tickers.
+                # Binance rejects the whole request if any pair is unlisted,
+                # so fall back to the full list in that case
+                symbols_param = "[" + ",".join(f'"{pair}"' for pair in wanted_pairs) + "]"
+                try:
+                    data = await self._http_get(
+                        self.SPOT_API,
+                        params={"type": "MINI", "symbols": symbols_param}
+                    )
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code != 400:
+                        raise
+                    self.logger.debug("Target pair lookup rejected, fetching all tickers")
+            if data is None:
+                data = await self._http_get(self.SPOT_API, params={"type": "MINI"})
 
             prices = []
             for item in data:
                 symbol_pair = item.get("symbol", "")
 
-                # Only process USDT pairs
-                if not symbol_pair.endswith("USDT"):
+                if wanted_pairs is not None:
+                    base_symbol = wanted_pairs.get(symbol_pair)
+                    if base_symbol is None:
+                        continue
+                elif symbol_pair.endswith("USDT"):
+                    # Only process USDT pairs
+                    base_symbol = symbol_pair[:-4]  # Remove "USDT"
+                else:
                     continue
 
-                # Extract base symbol
-                base_symbol = symbol_pair[:-4]  # Remove "USDT"
-
-                # Filter by target symbols if specified
-                if target_symbols and base_symbol not in target_symbols:
-                    continue
-
-                # Get price and volume
-                price_str = item.get("lastPrice")
-                volume_str = item.get("quoteVolume")  # Volume in USDT
-
-                if price_str is None:
+                # Get price and volume (volume in USDT)
+                price = self.parse_float(item.get("lastPrice"))
+                if price is None:
                     continue
 
-                price = float(price_str)
-                volume_24h = float(volume_str) if volume_str else None
+                volume_24h = self.parse_float(item.get("quoteVolume"))
 
                 prices.append({
                     "symbol": base_symbol,
@@ -164,7 +162,7 @@ class BinanceAdapter(BaseExchangeAdapter):
                     "volume_24h": volume_24h
                 })
 
-            self.logger.debug(f"Fetched {len(prices)} spot prices")
+            self.logger.debug("Fetched %d spot prices", len(prices))
             return prices
 
         except Exception as e:
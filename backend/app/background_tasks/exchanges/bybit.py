@@ -3,10 +3,9 @@ Bybit exchange adapter.
 Handles both funding rates and spot prices from Bybit.
 """
 
-from datetime import datetime
 from typing import List, Dict, Any, Optional
 
-from .base import BaseExchangeAdapter
+from .base import BaseExchangeAdapter, FundingRateEntry
 
 
 class BybitAdapter(BaseExchangeAdapter):
@@ -25,12 +24,12 @@ class BybitAdapter(BaseExchangeAdapter):
     def __init__(self):
         super().__init__("bybit")
 
-    async def fetch_funding_rates(self) -> List[Dict[str, Any]]:
+    async def fetch_funding_rates(self) -> List[FundingRateEntry]:
         """
         Fetch funding rates from Bybit linear perpetual contracts.
 
         Returns:
-            List of dicts with keys:
+            List of FundingRateEntry with fields:
             - symbol: str (normalized, e.g., "BTC")
             - rate: float (8-hour rate)
             - annualized_rate: float (APY percentage)
@@ -47,53 +46,38 @@ class BybitAdapter(BaseExchangeAdapter):
                 self.logger.error(f"Bybit API error: {data.get('retMsg')}")
                 return []
 
-            rates = []
+            # Keep USDT perpetuals with a usable rate in one pass over the list,
+            # checking the symbol before touching any numeric field. Pre-launch
+            # contracts report an empty fundingRate and are dropped here
+            parse_float = self.parse_float
+            rated_items = []
+            raw_rates = []
             for item in data.get("result", {}).get("list", []):
-                symbol = item.get("symbol", "")
-
-                # Only process USDT perpetual contracts
-                if not symbol.endswith("USDT"):
-                    continue
-
-                # Extract base symbol (e.g., BTCUSDT -> BTC)
-                base_symbol = symbol[:-4]
-
-                # Get funding rate
-                funding_rate = item.get("fundingRate")
-                if funding_rate is None:
+                if not item.get("symbol", "").endswith("USDT"):
                     continue
-
-                # Parse values
-                rate_8h = float(funding_rate)
-                annualized_rate = self.annualize_8h_rate(rate_8h)
-
-                # Get mark price
-                mark_price = item.get("markPrice")
-                mark_price_value = float(mark_price) if mark_price else None
-
-                # Get next funding time (Unix timestamp in milliseconds)
-                next_funding_time_str = item.get("nextFundingTime")
-                next_funding_time = None
-                if next_funding_time_str:
-                    try:
-                        next_funding_time = datetime.fromtimestamp(int(next_funding_time_str) / 1000)
-                    except (ValueError, TypeError):
-                        pass
-
-                # Get 24h turnover (for volume filtering)
-                turnover_24h = item.get("turnover24h")
-                turnover_value = float(turnover_24h) if turnover_24h else None
-
-                rates.append({
-                    "symbol": base_symbol,
-                    "rate": rate_8h,
-                    "annualized_rate": annualized_rate,
-                    "mark_price": mark_price_value,
-                    "next_funding_time": next_funding_time,
-                    "turnover_24h": turnover_value  # For volume filtering
-                })
-
-            self.logger.debug(f"Fetched {len(rates)} funding rates")
+                rate_8h = parse_float(item.get("fundingRate"))
+                if rate_8h is not None:
+                    rated_items.append(item)
+                    raw_rates.append(rate_8h)
+
+            # Annualize all rates in one vectorized pass
+            rates_8h, annualized_rates = self.annualize_8h_rates(raw_rates)
+
+            # Every rated item yields a row; per-row helpers are bound to locals once
+            parse_ms_timestamp = self.parse_ms_timestamp
+            rates = [
+                FundingRateEntry(
+                    symbol=item["symbol"][:-4],  # BTCUSDT -> BTC
+                    rate=rate_8h,
+                    annualized_rate=annualized_rate,
+                    mark_price=parse_float(item.get("markPrice")),
+                    next_funding_time=parse_ms_timestamp(item.get("nextFundingTime")),  # ms timestamp
+                    turnover_24h=parse_float(item.get("turnover24h"))  # For volume filtering
+                )
+                for item, rate_8h, annualized_rate in zip(rated_items, rates_8h, annualized_rates)
+            ]
+
+            self.logger.debug("Fetched %d funding rates", len(rates))
             return rates
 
         except Exception as e:
@@ -130,6 +114,10 @@ class BybitAdapter(BaseExchangeAdapter):
             if not isinstance(tickers, list):
                 return []
 
+            # Resolve wanted pairs up front so unwanted tickers are
+            # rejected with a single dict lookup
+            wanted_pairs = {f"{s}USDT": s for s in target_symbols} if target_symbols else None
+
             prices = []
             for item in tickers:
                 if not isinstance(item, dict):
@@ -137,37 +125,28 @@ class BybitAdapter(BaseExchangeAdapter):
 
                 symbol = item.get("symbol", "")
 
-                # Only process USDT pairs
-                if not symbol.endswith("USDT"):
-                    continue
-
-                # Extract base symbol
-                base_symbol = symbol[:-4]
-
-                # Filter by target symbols if specified
-                if target_symbols and base_symbol not in target_symbols:
+                if wanted_pairs is not None:
+                    base_symbol = wanted_pairs.get(symbol)
+                    if base_symbol is None:
+                        continue
+                elif symbol.endswith("USDT"):
+                    # Only process USDT pairs
+                    base_symbol = symbol[:-4]
+                else:
                     continue
 
                 # Get price and volume
-                last_price = item.get("lastPrice")
-                volume = item.get("volume24h")
-
-                if last_price is None:
+                price_value = self.parse_float(item.get("lastPrice"))
+                if price_value is None:
                     continue
 
-                try:
-                    price_value = float(last_price)
-                    volume_value = float(volume) if volume else None
-
-                    prices.append({
-                        "symbol": base_symbol,
-                        "price": price_value,
-                        "volume_24h": volume_value
-                    })
-                except (ValueError, TypeError):
-                    continue
+                prices.append({
+                    "symbol": base_symbol,
+                    "price": price_value,
+                    "volume_24h": self.parse_float(item.get("volume24h"))
+                })
 
-            self.logger.debug(f"Fetched {len(prices)} spot prices")
+            self.logger.debug("Fetched %d spot prices", len(prices))
             return prices
 
         except Exception as e:
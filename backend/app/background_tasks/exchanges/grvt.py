@@ -1,42 +1,50 @@
 """GRVT exchange adapter."""
 import asyncio
-from datetime import datetime
 from typing import List, Dict, Any
-from .base import BaseExchangeAdapter
+from .base import BaseExchangeAdapter, FundingRateEntry
 
 
 class GRVTAdapter(BaseExchangeAdapter):
     INSTRUMENTS_URL = "https://market-data.grvt.io/full/v1/instruments"
     FUNDING_URL = "https://market-data.grvt.io/full/v1/funding"
     
+    # Instrument listings rarely change; refresh the map hourly, not every poll
+    INSTRUMENTS_TTL_SECONDS = 3600
+    
     def __init__(self):
         super().__init__("grvt")
     
-    async def fetch_funding_rates(self) -> List[Dict[str, Any]]:
+    async def _fetch_instrument_map(self) -> Dict[str, str]:
+        """Map instrument id -> base symbol for active USDT perpetuals."""
+        instruments_data = await self._http_post(self.INSTRUMENTS_URL, json_data={
+            "kind": ["PERPETUAL"],
+            "quote": ["USDT"],
+            "is_active": True
+        }, timeout=30.0)
+        
+        instrument_map = {}
+        for inst in instruments_data.get("result", []):
+            instrument_id = inst.get("instrument")
+            base = inst.get("base", "")
+            if instrument_id and base:
+                instrument_map[instrument_id] = base.upper()
+        return instrument_map
+    
+    async def fetch_funding_rates(self) -> List[FundingRateEntry]:
         try:
-            # Fetch instruments and funding data
-            instruments_data, funding_data = await asyncio.gather(
-                self._http_post(self.INSTRUMENTS_URL, json_data={
-                    "kind": ["PERPETUAL"],
-                    "quote": ["USDT"],
-                    "is_active": True
-                }, timeout=30.0),
+            # Fetch instrument map (cached) and funding data
+            instrument_map, funding_data = await asyncio.gather(
+                self._get_cached("instruments", self.INSTRUMENTS_TTL_SECONDS, self._fetch_instrument_map),
                 self._http_post(self.FUNDING_URL, json_data={
                     "kind": ["PERPETUAL"],
                     "quote": ["USDT"]
                 }, timeout=30.0)
             )
             
-            # Build instrument map
-            instrument_map = {}
-            for inst in instruments_data.get("result", []):
-                instrument_id = inst.get("instrument")
-                base = inst.get("base", "")
-                if instrument_id and base:
-                    instrument_map[instrument_id] = base.upper()
-            
-            # Process funding data
-            rates = []
+            # Keep entries for known instruments with a usable rate,
+            # then annualize them in one batch
+            rated_entries = []
+            raw_rates = []
             for entry in funding_data.get("result", []):
                 instrument_id = entry.get("instrument")
                 if not instrument_id:
@@ -46,33 +54,28 @@ class GRVTAdapter(BaseExchangeAdapter):
                 if not symbol:
                     continue
 
-                rate = entry.get("funding_rate")
-                if rate is None:
-                    continue
-                
-                rate_8h = float(rate)
-                annualized_rate = self.annualize_8h_rate(rate_8h)
-                
-                mark_price = entry.get("mark_price")
-                mark_price_value = float(mark_price) if mark_price else None
+                rate_8h = self.parse_float(entry.get("funding_rate"))
+                if rate_8h is not None:
+                    rated_entries.append((symbol, entry))
+                    raw_rates.append(rate_8h)
+            rates_8h, annualized_rates = self.annualize_8h_rates(raw_rates)
+
+            # Process funding data
+            rates = []
+            for (symbol, entry), rate_8h, annualized_rate in zip(rated_entries, rates_8h, annualized_rates):
+                mark_price_value = self.parse_float(entry.get("mark_price"))
                 
-                next_time_str = entry.get("next_funding_time")
-                next_funding_time = None
-                if next_time_str:
-                    try:
-                        next_funding_time = datetime.fromisoformat(next_time_str.replace('Z', '+00:00'))
-                    except:
-                        pass
+                next_funding_time = self.parse_iso_timestamp(entry.get("next_funding_time"))
                 
-                rates.append({
-                    "symbol": symbol,
-                    "rate": rate_8h,
-                    "annualized_rate": annualized_rate,
-                    "mark_price": mark_price_value,
-                    "next_funding_time": next_funding_time
-                })
+                rates.append(FundingRateEntry(
+                    symbol=symbol,
+                    rate=rate_8h,
+                    annualized_rate=annualized_rate,
+                    mark_price=mark_price_value,
+                    next_funding_time=next_funding_time
+                ))
             
-            self.logger.debug(f"Fetched {len(rates)} funding rates")
+            self.logger.debug("Fetched %d funding rates", len(rates))
             return rates
         except Exception as e:
             self.logger.error(f"Error: {e}")
@@ -5,7 +5,7 @@ Handles funding rates from Hyperliquid.
 
 from typing import List, Dict, Any
 
-from .base import BaseExchangeAdapter
+from .base import BaseExchangeAdapter, FundingRateEntry
 
 
 class HyperliquidAdapter(BaseExchangeAdapter):
@@ -21,7 +21,7 @@ class HyperliquidAdapter(BaseExchangeAdapter):
     def __init__(self):
         super().__init__("hyperliquid")
 
-    async def fetch_funding_rates(self) -> List[Dict[str, Any]]:
+    async def fetch_funding_rates(self) -> List[FundingRateEntry]:
         """
         Fetch funding rates from Hyperliquid.
 
@@ -29,7 +29,7 @@ class HyperliquidAdapter(BaseExchangeAdapter):
         to 8-hour equivalent for consistency.
 
         Returns:
-            List of dicts with keys:
+            List of FundingRateEntry with fields:
             - symbol: str (e.g., "BTC", "ETH", "SOL")
             - rate: float (8-hour equivalent)
             - annualized_rate: float (APY percentage)
@@ -56,35 +56,40 @@ class HyperliquidAdapter(BaseExchangeAdapter):
             if len(universe) != len(asset_contexts):
                 self.logger.warning(f"Mismatch: {len(universe)} symbols but {len(asset_contexts)} contexts")
 
-            rates = []
-            for i, (meta, ctx) in enumerate(zip(universe, asset_contexts)):
-                coin_name = meta.get("name", "")
-
-                # Hyperliquid provides 1-hour rate
-                funding_1h = ctx.get("funding")
-                mark_price = ctx.get("markPx")
-                volume_24h = ctx.get("dayNtlVlm")  # 24h notional volume for filtering
-
-                if funding_1h is None:
+            # Hyperliquid provides 1-hour rate. One pass over the paired
+            # universe/context arrays pulls the needed fields of assets that
+            # have a rate into parallel columns, with no per-asset tuple
+            parse_float = self.parse_float
+            coin_names = []
+            raw_rates = []
+            mark_prices = []
+            volumes = []
+            for meta, ctx in zip(universe, asset_contexts):
+                rate_1h = parse_float(ctx.get("funding"))
+                if rate_1h is None:
                     continue
-
-                # Convert 1h rate to 8h for consistency
-                rate_1h = float(funding_1h)
-                rate_8h = rate_1h * 8
-                annualized_rate = self.annualize_1h_rate(rate_1h)
-                mark_price_val = float(mark_price) if mark_price else None
-                volume_val = float(volume_24h) if volume_24h else None
-
-                rates.append({
-                    "symbol": coin_name,
-                    "rate": rate_8h,  # Store as 8-hour equivalent
-                    "annualized_rate": annualized_rate,
-                    "mark_price": mark_price_val,
-                    "next_funding_time": None,  # Hyperliquid doesn't provide this
-                    "turnover_24h": volume_val  # For volume filtering
-                })
-
-            self.logger.debug(f"Fetched {len(rates)} funding rates")
+                coin_names.append(meta.get("name", ""))
+                raw_rates.append(rate_1h)
+                mark_prices.append(parse_float(ctx.get("markPx")))
+                volumes.append(parse_float(ctx.get("dayNtlVlm")))  # 24h notional volume for filtering
+
+            # Annualize the whole rate column in one batch
+            rates_1h, annualized_rates = self.annualize_1h_rates(raw_rates)
+
+            rates = [
+                FundingRateEntry(
+                    symbol=coin_name,
+                    rate=rate_1h * 8,  # Store as 8-hour equivalent
+                    annualized_rate=annualized_rate,
+                    mark_price=mark_price,
+                    next_funding_time=None,  # Hyperliquid doesn't provide this
+                    turnover_24h=volume  # For volume filtering
+                )
+                for coin_name, rate_1h, annualized_rate, mark_price, volume
+                in zip(coin_names, rates_1h, annualized_rates, mark_prices, volumes)
+            ]
+
+            self.logger.debug("Fetched %d funding rates", len(rates))
             return rates
 
         except Exception as e:
@@ -1,5 +1,6 @@
 """Jupiter exchange adapter (Solana DEX aggregator)."""
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
 from .base import BaseExchangeAdapter
 
 # USD-priced tokens (get price via USDC swap quote)
@@ -35,93 +36,93 @@ class JupiterAdapter(BaseExchangeAdapter):
     async def fetch_funding_rates(self) -> List[Dict[str, Any]]:
         return []
 
+    async def _fetch_quote(self, symbol: str, input_mint: str, output_mint: str, amount: int) -> Optional[Tuple[int, int]]:
+        """
+        Fetch one swap quote.
+
+        Returns:
+            (inAmount, outAmount), or None if the request failed or the quote is empty
+        """
+        try:
+            data = await self._http_get(
+                self.QUOTE_URL,
+                params={
+                    'inputMint': input_mint,
+                    'outputMint': output_mint,
+                    'amount': amount,
+                    'slippageBps': 50
+                }
+            )
+
+            in_amount = int(data.get('inAmount', 0))
+            out_amount = int(data.get('outAmount', 0))
+        except Exception as e:
+            self.logger.error(f"Error fetching {symbol} quote: {e}")
+            return None
+
+        if in_amount == 0 or out_amount == 0:
+            self.logger.warning(f"Invalid quote for {symbol}")
+            return None
+        return in_amount, out_amount
+
     async def fetch_spot_prices(self) -> List[Dict[str, Any]]:
         """
         Fetch spot prices from Jupiter swap quotes.
 
         Returns USD prices for tokens (via USDC) and LST ratios (vs SOL).
+        All quotes are requested concurrently over the shared client.
         """
         try:
+            # USD prices use 1 token -> USDC; LST ratios use 1 SOL -> LST
+            usd_quotes = [
+                self._fetch_quote(symbol, token_address, USDC_ADDRESS, 10 ** token_decimals)
+                for symbol, (token_address, token_decimals) in USD_TOKENS.items()
+            ]
+            lst_quotes = [
+                self._fetch_quote(symbol, SOL_ADDRESS, lst_address, 10 ** SOL_DECIMALS)
+                for symbol, lst_address in LST_TOKENS.items()
+            ]
+            quotes = await asyncio.gather(*usd_quotes, *lst_quotes)
+            usd_results = quotes[:len(usd_quotes)]
+            lst_results = quotes[len(usd_quotes):]
+
             prices = []
 
-            # Fetch USD prices (Token -> USDC quotes)
-            for symbol, (token_address, token_decimals) in USD_TOKENS.items():
-                try:
-                    # Use 1 token as base amount
-                    base_amount = 10 ** token_decimals
-
-                    data = await self._http_get(
-                        self.QUOTE_URL,
-                        params={
-                            'inputMint': token_address,
-                            'outputMint': USDC_ADDRESS,
-                            'amount': base_amount,
-                            'slippageBps': 50
-                        }
-                    )
-
-                    in_amount = int(data.get('inAmount', 0))
-                    out_amount = int(data.get('outAmount', 0))
-
-                    if in_amount == 0 or out_amount == 0:
-                        self.logger.warning(f"Invalid quote for {symbol}")
-                        continue
-
-                    # Calculate USD price
-                    # Price = (outAmount / 10^usdc_decimals) / (inAmount / 10^token_decimals)
-                    price = (out_amount * (10 ** token_decimals)) / (in_amount * (10 ** USDC_DECIMALS))
-
-                    prices.append({
-                        "symbol": symbol,
-                        "price": float(price),
-                        "volume_24h": None
-                    })
-
-                    self.logger.info(f"Jupiter {symbol} price: ${price:.2f}")
-
-                except Exception as e:
-                    self.logger.error(f"Error fetching {symbol} price: {e}")
-
-            # Fetch LST ratios (SOL -> LST quotes)
-            for symbol, lst_address in LST_TOKENS.items():
-                try:
-                    # Use 1 SOL as base amount
-                    base_amount = 10 ** SOL_DECIMALS
-
-                    data = await self._http_get(
-                        self.QUOTE_URL,
-                        params={
-                            'inputMint': SOL_ADDRESS,
-                            'outputMint': lst_address,
-                            'amount': base_amount,
-                            'slippageBps': 50
-                        }
-                    )
-
-                    in_amount = int(data.get('inAmount', 0))
-                    out_amount = int(data.get('outAmount', 0))
-
-                    if in_amount == 0 or out_amount == 0:
-                        self.logger.warning(f"Invalid quote for {symbol}")
-                        continue
-
-                    # Get LST decimals from first quote
-                    # Ratio = how many LST tokens per 1 SOL
-                    # Since amounts already include decimals, just divide
-                    ratio = out_amount / in_amount
-
-                    prices.append({
-                        "symbol": symbol,
-                        "price": float(ratio),
-                        "volume_24h": None
-                    })
-
-                    self.logger.info(f"Jupiter {symbol} ratio: {ratio:.6f}")
-
-                except Exception as e:
-                    self.logger.error(f"Error fetching {symbol} ratio: {e}")
-
-            self.logger.debug(f"Fetched {len(prices)} spot prices")
+            for (symbol, (_, token_decimals)), quote in zip(USD_TOKENS.items(), usd_results):
+                if quote is None:
+                    continue
+                in_amount, out_amount = quote
+
+                # Calculate USD price
+                # Price = (outAmount / 10^usdc_decimals) / (inAmount / 10^token_decimals)
+                price = (out_amount * (10 ** token_decimals)) / (in_amount * (10 ** USDC_DECIMALS))
+
+                prices.append({
+                    "symbol": symbol,
+                    "price": price,
+                    "volume_24h": None
+                })
+
+                self.logger.info(f"Jupiter {symbol} price: ${price:.2f}")
+
+            for symbol, quote in zip(LST_TOKENS, lst_results):
+                if quote is None:
+                    continue
+                in_amount, out_amount = quote
+
+                # Ratio = how many LST tokens per 1 SOL
+                # Since amounts already include decimals, just divide
+                ratio = out_amount / in_amount
+
+                prices.append({
+                    "symbol": symbol,
+                    "price": ratio,
+                    "volume_24h": None
+                })
+
+                self.logger.info(f"Jupiter {symbol} ratio: {ratio:.6f}")
+
+            self.logger.debug("Fetched %d spot prices", len(prices))
             return prices
 
         except Exception as e:
@@ -5,7 +5,11 @@ Handles funding rates and account data from Lighter.
 
 from typing import List, Dict, Any
 
-from .base import BaseExchangeAdapter
+from .base import BaseExchangeAdapter, FundingRateEntry
+
+# Request headers never change; build them once instead of per request.
+# Accept is already a default header on the shared client.
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class LighterAdapter(BaseExchangeAdapter):
@@ -24,12 +28,12 @@ class LighterAdapter(BaseExchangeAdapter):
         self.api_client = None
         self.account_api = None
 
-    async def fetch_funding_rates(self) -> List[Dict[str, Any]]:
+    async def fetch_funding_rates(self) -> List[FundingRateEntry]:
         """
         Fetch funding rates from Lighter.
 
         Returns:
-            List of dicts with keys:
+            List of FundingRateEntry with fields:
             - symbol: str (e.g., "BTC", "ETH", "SOL")
             - rate: float (8-hour rate)
             - annualized_rate: float (APY percentage)
@@ -37,45 +41,44 @@ class LighterAdapter(BaseExchangeAdapter):
             - next_funding_time: None (not provided)
         """
         try:
-            data = await self._http_get(
-                self.API_URL,
-                headers={
-                    "Accept": "application/json",
-                    "Content-Type": "application/json"
-                }
-            )
+            data = await self._http_get(self.API_URL, headers=JSON_HEADERS)
 
             funding_rates = data.get("funding_rates", [])
-            rates = []
 
+            # Keep Lighter's own entries with a (numeric) rate
+            rated_entries = []
+            raw_rates = []
             for entry in funding_rates:
-                symbol = entry.get("symbol", "").upper()
                 exchange = entry.get("exchange", "lighter").lower()
-                rate = entry.get("rate")
 
                 # Only process 'lighter' exchange
                 if exchange != "lighter":
                     continue
 
-                # Skip if no rate available
-                if rate is None:
-                    continue
+                rate_value = self.parse_float(entry.get("rate"))
+                if rate_value is not None:
+                    rated_entries.append(entry)
+                    raw_rates.append(rate_value)
 
-                # Convert rate to float
-                rate_value = float(rate)
+            # Annualize the 8-hour rates in one batch
+            rates_8h, annualized_rates = self.annualize_8h_rates(raw_rates)
 
-                # Annualize the 8-hour rate
-                annualized_rate = self.annualize_8h_rate(rate_value)
-
-                rates.append({
-                    "symbol": symbol,
-                    "rate": rate_value,
-                    "annualized_rate": annualized_rate,
-                    "mark_price": None,  # Not available in API response
-                    "next_funding_time": None  # Not available in API response
-                })
-
-            self.logger.debug(f"Fetched {len(rates)} funding rates")
+            rates = []
+            for entry, rate_value, annualized_rate in zip(rated_entries, rates_8h, annualized_rates):
+                # Symbols arrive uppercase; only copy the rare one that isn't
+                symbol = entry.get("symbol", "")
+                if not symbol.isupper():
+                    symbol = symbol.upper()
+
+                rates.append(FundingRateEntry(
+                    symbol=symbol,
+                    rate=rate_value,
+                    annualized_rate=annualized_rate,
+                    mark_price=None,  # Not available in API response
+                    next_funding_time=None  # Not available in API response
+                ))
+
+            self.logger.debug("Fetched %d funding rates", len(rates))
             return rates
 
         except Exception as e:
@@ -135,8 +138,9 @@ class LighterAdapter(BaseExchangeAdapter):
 
             account = response.accounts[0]
 
-            # Calculate account value
-            collateral = float(account.collateral) if hasattr(account, 'collateral') and account.collateral else 0
+            # Calculate account value (SDK returns numeric fields as strings)
+            parse_float = self.parse_float
+            collateral = parse_float(getattr(account, 'collateral', None)) or 0
 
             # Sum unrealized PnL from all positions
             total_unrealized_pnl = 0
@@ -145,13 +149,16 @@ class LighterAdapter(BaseExchangeAdapter):
             if hasattr(account, 'positions'):
                 for position in account.positions:
                     # Get unrealized PnL
-                    if hasattr(position, 'unrealized_pnl') and position.unrealized_pnl:
-                        total_unrealized_pnl += float(position.unrealized_pnl)
+                    unrealized_pnl = parse_float(getattr(position, 'unrealized_pnl', None))
+                    if unrealized_pnl:
+                        total_unrealized_pnl += unrealized_pnl
 
-                    # Get position size (with sign)
+                    # Get position size (with sign); skip unparseable sizes
                     if hasattr(position, 'symbol') and hasattr(position, 'position'):
                         symbol = position.symbol
-                        pos_size = float(position.position)
+                        pos_size = parse_float(position.position)
+                        if pos_size is None:
+                            continue
 
                         # Apply sign
                         if hasattr(position, 'sign'):
@@ -32,31 +32,34 @@ class OKXAdapter(BaseExchangeAdapter):
                 self.logger.error(f"OKX API error: {data.get('msg')}")
                 return []
 
+            # Resolve wanted instruments up front so unwanted tickers are
+            # rejected with a single dict lookup instead of a list scan
+            wanted_pairs = {f"{s}-USDT": s for s in target_symbols} if target_symbols else None
+
             prices = []
             for item in data.get("data", []):
                 inst_id = item.get("instId", "")
-                if not inst_id.endswith("-USDT"):
-                    continue
 
-                base_symbol = inst_id.replace("-USDT", "")
-
-                # Filter by target symbols if specified
-                if target_symbols and base_symbol not in target_symbols:
+                if wanted_pairs is not None:
+                    base_symbol = wanted_pairs.get(inst_id)
+                    if base_symbol is None:
+                        continue
+                elif inst_id.endswith("-USDT"):
+                    base_symbol = inst_id[:-5]  # Remove "-USDT"
+                else:
                     continue
 
-                last_price = item.get("last")
-                volume = item.get("volCcy24h")
-
+                last_price = self.parse_float(item.get("last"))
                 if last_price is None:
                     continue
 
                 prices.append({
                     "symbol": base_symbol,
-                    "price": float(last_price),
-                    "volume_24h": float(volume) if volume else None
+                    "price": last_price,
+                    "volume_24h": self.parse_float(item.get("volCcy24h"))
                 })
 
-            self.logger.debug(f"Fetched {len(prices)} spot prices")
+            self.logger.debug("Fetched %d spot prices", len(prices))
             return prices
         except Exception as e:
             self.logger.error(f"Error: {e}")
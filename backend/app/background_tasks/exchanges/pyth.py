@@ -20,6 +20,10 @@ TARGET_SYMBOLS = {
     "0x7d9e2258cec229cf52873a8e58d035a276873c485d753860e56d248fb33ce68a": "bbSOL/SOL",
 }
 
+# Every request asks Hermes for the same feed IDs
+PRICE_ID_PARAMS = {"ids[]": tuple(TARGET_SYMBOLS)}
+
+
 class PythAdapter(BaseExchangeAdapter):
     API_URL = "https://hermes.pyth.network/v2/updates/price/latest"
     
@@ -31,10 +35,7 @@ class PythAdapter(BaseExchangeAdapter):
     
     async def fetch_spot_prices(self) -> List[Dict[str, Any]]:
         try:
-            price_ids = list(TARGET_SYMBOLS.keys())
-            params = {"ids[]": price_ids}
-            
-            data = await self._http_get(self.API_URL, params=params)
+            data = await self._http_get(self.API_URL, params=PRICE_ID_PARAMS)
             prices = []
             
             for feed in data.get("parsed", []):
@@ -44,13 +45,13 @@ class PythAdapter(BaseExchangeAdapter):
                     continue
                 
                 price_data = feed.get("price", {})
-                price_str = price_data.get("price")
+                raw_price = self.parse_float(price_data.get("price"))
                 expo = price_data.get("expo", 0)
                 
-                if price_str is None:
+                if raw_price is None:
                     continue
                 
-                price = float(price_str) * (10 ** expo)
+                price = raw_price * (10 ** expo)
                 
                 prices.append({
                     "symbol": symbol,
@@ -58,7 +59,7 @@ class PythAdapter(BaseExchangeAdapter):
                     "volume_24h": None
                 })
             
-            self.logger.debug(f"Fetched {len(prices)} spot prices")
+            self.logger.debug("Fetched %d spot prices", len(prices))
             return prices
         except Exception as e:
             self.logger.error(f"Error: {e}")
@@ -3,6 +3,7 @@ Funding rates monitor (coordinator).
 Orchestrates fetching funding rates from all exchanges.
 """
 
+import asyncio
 from datetime import datetime
 from typing import List, Type
 
@@ -10,7 +11,7 @@ from app.core.logger import get_logger
 from app.models.database import FundingRate, get_db_session
 # Direct import to avoid circular dependency from __init__.py
 from app.background_tasks.base import BaseMonitor
-from app.background_tasks.exchanges.base import BaseExchangeAdapter
+from app.background_tasks.exchanges.base import BaseExchangeAdapter, FundingRateEntry
 from app.background_tasks.exchanges import (
     BinanceAdapter,
     BybitAdapter,
@@ -57,13 +58,21 @@ class FundingRateMonitor(BaseMonitor):
         """Fetch funding rates from all exchanges."""
         logger.debug("Fetching funding rates from all exchanges...")
 
+        # Exchanges are independent, so fetch them all concurrently;
+        # storage below stays sequential because SQLite serializes writers
+        results = await asyncio.gather(
+            *(adapter.fetch_funding_rates() for adapter in self.adapters),
+            return_exceptions=True
+        )
+
         total_stored = 0
 
-        for adapter in self.adapters:
-            try:
-                # Fetch rates from this exchange
-                rates = await adapter.fetch_funding_rates()
+        for adapter, rates in zip(self.adapters, results):
+            if isinstance(rates, Exception):
+                logger.error(f"[{adapter.exchange_name}] Error: {rates}", exc_info=rates)
+                continue
 
+            try:
                 if not rates:
                     logger.warning(f"[{adapter.exchange_name}] No rates fetched")
                     continue
@@ -75,7 +84,7 @@ class FundingRateMonitor(BaseMonitor):
                     logger.info(f"[{adapter.exchange_name}] Filtered {len(rates)} → {len(filtered_rates)} (top 50 by volume)")
 
                 # Store in database
-                stored_count = await self._store_rates(adapter.exchange_name, filtered_rates)
+                stored_count = await asyncio.to_thread(self._store_rates, adapter.exchange_name, filtered_rates)
                 total_stored += stored_count
 
                 logger.info(f"[{adapter.exchange_name}] Stored {stored_count} rates")
@@ -86,91 +95,68 @@ class FundingRateMonitor(BaseMonitor):
 
         logger.info(f"Total stored: {total_stored} funding rates across {len(self.adapters)} exchanges")
 
-    def _filter_top_by_volume(self, rates: List[dict], limit: int = 50) -> List[dict]:
+    def _filter_top_by_volume(self, rates: List[FundingRateEntry], limit: int = 50) -> List[FundingRateEntry]:
         """
-        Filter funding rates to top N by volume/turnover.
+        Filter funding rates to top N by turnover.
 
         Args:
-            rates: List of funding rate dicts (may include 'volume_24h' or 'turnover_24h')
+            rates: List of funding rate entries (turnover_24h may be None)
             limit: Maximum number of rates to keep
 
         Returns:
-            Filtered list (top N by volume, or all if no volume data)
+            Filtered list (top N by turnover, or all if no turnover data)
         """
         if not rates or len(rates) <= limit:
             return rates
 
-        # Check if rates have volume/turnover data
-        has_volume = any(r.get('volume_24h') is not None or r.get('turnover_24h') is not None for r in rates)
-
-        if not has_volume:
+        # Check if rates have turnover data
+        if all(r.turnover_24h is None for r in rates):
             # No volume data, return all
             return rates
 
-        # Sort by turnover (preferred) or volume, then take top N
-        def get_volume_key(rate):
-            # Prefer turnover_24h (USDT value), fallback to volume_24h
-            turnover = rate.get('turnover_24h')
-            if turnover is not None:
-                try:
-                    return float(turnover)
-                except (ValueError, TypeError):
-                    pass
-
-            volume = rate.get('volume_24h')
-            if volume is not None:
-                try:
-                    return float(volume)
-                except (ValueError, TypeError):
-                    pass
-
-            return 0
-
-        # Sort descending by volume
-        sorted_rates = sorted(rates, key=get_volume_key, reverse=True)
+        # Sort descending by turnover (already parsed to float by the adapters), then take top N
+        sorted_rates = sorted(rates, key=lambda r: r.turnover_24h or 0, reverse=True)
         return sorted_rates[:limit]
 
-    async def _store_rates(self, exchange_name: str, rates: List[dict]) -> int:
+    def _store_rates(self, exchange_name: str, rates: List[FundingRateEntry]) -> int:
         """
         Store funding rates in database.
 
         Args:
             exchange_name: Exchange identifier
-            rates: List of rate dictionaries
+            rates: List of funding rate entries
 
         Returns:
             Number of rates stored
         """
         db = get_db_session()
-        stored_count = 0
 
         try:
+            # One timestamp per batch so every row from this pass lines up
+            timestamp = datetime.utcnow()
+
+            rows = []
             for entry in rates:
                 # Validate required fields
-                symbol = entry.get("symbol")
-                rate = entry.get("rate")
-                annualized_rate = entry.get("annualized_rate")
-
-                if not symbol or rate is None or annualized_rate is None:
+                if not entry.symbol or entry.rate is None or entry.annualized_rate is None:
                     logger.warning(f"[{exchange_name}] Skipping invalid entry: {entry}")
                     continue
 
-                # Create funding rate entry
-                new_rate = FundingRate(
-                    exchange=exchange_name,
-                    symbol=symbol,
-                    rate=float(rate),
-                    annualized_rate=float(annualized_rate),
-                    next_funding_time=entry.get("next_funding_time"),
-                    mark_price=float(entry["mark_price"]) if entry.get("mark_price") else None,
-                    timestamp=datetime.utcnow()
-                )
-
-                db.add(new_rate)
-                stored_count += 1
-
+                rows.append({
+                    "exchange": exchange_name,
+                    "symbol": entry.symbol,
+                    "rate": float(entry.rate),
+                    "annualized_rate": float(entry.annualized_rate),
+                    "next_funding_time": entry.next_funding_time,
+                    "mark_price": float(entry.mark_price) if entry.mark_price else None,
+                    "timestamp": timestamp
+                })
+
+            # Core executemany INSERT; bypasses the ORM bulk-mapping layer
+            if rows:
+                db.execute(FundingRate.__table__.insert(), rows)
             db.commit()
-            return stored_count
+            return len(rows)
 
         except Exception as e:
             logger.error(f"[{exchange_name}] Error storing rates: {e}")
@@ -0,0 +1,53 @@
+"""
+Shared HTTP resources for background tasks.
+All exchange adapters reuse one pooled httpx client so monitors that tick
+close together share TCP/TLS connections instead of each opening their own.
+Solana RPC callers share one concurrency limit.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+# Caps in-flight requests to the public Solana RPC across all monitors
+# (JLP/ALP hedge calculators tick together and would otherwise trip 429s)
+SOLANA_RPC_SEMAPHORE = asyncio.Semaphore(5)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    HTTP/2 is negotiated where the server supports it, so concurrent
+    requests to the same host are multiplexed over one connection.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            # Keep idle connections across monitor ticks: spot prices poll
+            # every 60s and funding rates every 300s, so 310s covers both
+            # (httpx's default 5s expiry would reconnect on every tick)
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=310.0
+            ),
+            headers={"Accept": "application/json"},
+            timeout=10.0
+        )
+    return _client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client (call once on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
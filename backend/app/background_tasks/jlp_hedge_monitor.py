@@ -6,6 +6,7 @@ Formula: hedge = (owned - locked + shortOI + fees×0.75) / totalSupply × jlpAmo
 """
 
 import asyncio
+import logging
 import struct
 from datetime import datetime
 from typing import Dict, Any
@@ -14,6 +15,7 @@ import os
 from app.core.logger import get_logger
 from app.models.database import WebhookData, AppSetting, get_db_session
 from app.background_tasks.base import BaseMonitor
+from app.background_tasks.http_client import SOLANA_RPC_SEMAPHORE
 
 logger = get_logger(__name__)
 
@@ -66,7 +68,8 @@ class JLPHedgeMonitor(BaseMonitor):
             logger.debug("JLP amount is 0, skipping hedge calculation")
             return
 
-        logger.debug(f"Calculating JLP hedge positions for {jlp_amount:,.2f} JLP...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Calculating JLP hedge positions for {jlp_amount:,.2f} JLP...")
 
         try:
             # Calculate hedge positions
@@ -77,7 +80,7 @@ class JLPHedgeMonitor(BaseMonitor):
                 return
 
             # Store data
-            stored_count = await self._store_hedge_data(hedge_positions)
+            stored_count = await asyncio.to_thread(self._store_hedge_data, hedge_positions)
             logger.info(f"Stored {stored_count} JLP hedge positions")
 
         except Exception as e:
@@ -93,7 +96,8 @@ class JLPHedgeMonitor(BaseMonitor):
             from solders.pubkey import Pubkey
 
             mint = Pubkey.from_string(JLP_MINT)
-            response = await client.get_token_supply(mint)
+            async with SOLANA_RPC_SEMAPHORE:
+                response = await client.get_token_supply(mint)
 
             if response.value:
                 amount = float(response.value.amount)
@@ -111,7 +115,8 @@ class JLPHedgeMonitor(BaseMonitor):
             from solders.pubkey import Pubkey
 
             pubkey = Pubkey.from_string(custody_addr)
-            response = await client.get_account_info(pubkey)
+            async with SOLANA_RPC_SEMAPHORE:
+                response = await client.get_account_info(pubkey)
 
             if not response.value or not response.value.data:
                 raise ValueError(f"Failed to get custody: {custody_addr}")
@@ -191,29 +196,30 @@ class JLPHedgeMonitor(BaseMonitor):
             logger.error(f"Error calculating hedge positions: {e}", exc_info=True)
             return {}
 
-    async def _store_hedge_data(self, hedge_positions: Dict[str, Dict[str, float]]) -> int:
+    def _store_hedge_data(self, hedge_positions: Dict[str, Dict[str, float]]) -> int:
         """Store hedge position data in database."""
         db = get_db_session()
-        stored_count = 0
 
         try:
             timestamp = datetime.utcnow()
 
             # Store each hedge position
+            rows = []
             for symbol, data in hedge_positions.items():
-                hedge_data = WebhookData(
-                    monitor_id=f'jlp_hedge_{symbol}',
-                    monitor_name=f'JLP {symbol} 对冲量',
-                    value=data['amount'],
-                    timestamp=timestamp
-                )
-                db.add(hedge_data)
-                stored_count += 1
+                rows.append({
+                    'monitor_id': f'jlp_hedge_{symbol}',
+                    'monitor_name': f'JLP {symbol} 对冲量',
+                    'value': data['amount'],
+                    'timestamp': timestamp
+                })
 
                 logger.info(f"JLP Hedge {symbol}: {data['amount']:+.8f} (per JLP: {data['per_jlp']:.10f})")
 
+            # Core executemany INSERT; bypasses the ORM bulk-mapping layer
+            if rows:
+                db.execute(WebhookData.__table__.insert(), rows)
             db.commit()
-            return stored_count
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Error storing JLP hedge data: {e}")
@@ -3,6 +3,7 @@ Spot prices monitor (coordinator).
 Orchestrates fetching spot prices from all exchanges.
 """
 
+import asyncio
 import json
 from datetime import datetime
 from typing import List, Type, Optional
@@ -39,6 +40,9 @@ class SpotPriceMonitor(BaseMonitor):
         PythAdapter,
     ]
 
+    # CEX adapters whose fetch_spot_prices accepts target_symbols
+    TARGET_FILTER_EXCHANGES = frozenset({'binance', 'bybit', 'okx'})
+
     def __init__(self, interval: int = 60):
         """
         Initialize spot prices monitor.
@@ -90,26 +94,37 @@ class SpotPriceMonitor(BaseMonitor):
 
         # Get target symbols for CEX (Binance, Bybit, OKX)
         cex_target_symbols = self._get_cex_target_symbols()
-        logger.debug(f"CEX target symbols: {cex_target_symbols}")
+        logger.debug("CEX target symbols: %s", cex_target_symbols)
+
+        async def fetch(adapter: BaseExchangeAdapter) -> List[dict]:
+            # CEX adapters (Binance, Bybit, OKX) support filtering
+            # Jupiter and Pyth have hardcoded token lists
+            if adapter.exchange_name in self.TARGET_FILTER_EXCHANGES:
+                return await adapter.fetch_spot_prices(target_symbols=cex_target_symbols)
+            # Jupiter and Pyth don't support filtering (hardcoded lists)
+            return await adapter.fetch_spot_prices()
+
+        # Exchanges are independent, so fetch them all concurrently;
+        # storage below stays sequential because SQLite serializes writers
+        results = await asyncio.gather(
+            *(fetch(adapter) for adapter in self.adapters),
+            return_exceptions=True
+        )
 
         total_stored = 0
 
-        for adapter in self.adapters:
-            try:
-                # CEX adapters (Binance, Bybit, OKX) support filtering
-                # Jupiter and Pyth have hardcoded token lists
-                if adapter.exchange_name in ['binance', 'bybit', 'okx']:
-                    prices = await adapter.fetch_spot_prices(target_symbols=cex_target_symbols)
-                else:
-                    # Jupiter and Pyth don't support filtering (hardcoded lists)
-                    prices = await adapter.fetch_spot_prices()
+        for adapter, prices in zip(self.adapters, results):
+            if isinstance(prices, Exception):
+                logger.error(f"[{adapter.exchange_name}] Error: {prices}", exc_info=prices)
+                continue
 
+            try:
                 if not prices:
                     logger.warning(f"[{adapter.exchange_name}] No prices fetched")
                     continue
 
                 # Store in database
-                stored_count = await self._store_prices(adapter.exchange_name, prices)
+                stored_count = await asyncio.to_thread(self._store_prices, adapter.exchange_name, prices)
                 total_stored += stored_count
 
                 logger.info(f"[{adapter.exchange_name}] Stored {stored_count} prices")
@@ -120,7 +135,7 @@ class SpotPriceMonitor(BaseMonitor):
 
         logger.info(f"Total stored: {total_stored} spot prices across {len(self.adapters)} exchanges")
 
-    async def _store_prices(self, exchange_name: str, prices: List[dict]) -> int:
+    def _store_prices(self, exchange_name: str, prices: List[dict]) -> int:
         """
         Store spot prices in database.
 
@@ -132,9 +147,12 @@ class SpotPriceMonitor(BaseMonitor):
             Number of prices stored
         """
         db = get_db_session()
-        stored_count = 0
 
         try:
+            # One timestamp per batch so every row from this pass lines up
+            timestamp = datetime.utcnow()
+
+            rows = []
             for entry in prices:
                 # Validate required fields
                 symbol = entry.get("symbol")
@@ -144,20 +162,19 @@ class SpotPriceMonitor(BaseMonitor):
                     logger.warning(f"[{exchange_name}] Skipping invalid entry: {entry}")
                     continue
 
-                # Create spot price entry
-                new_price = SpotPrice(
-                    exchange=exchange_name,
-                    symbol=symbol,
-                    price=float(price),
-                    volume_24h=float(entry["volume_24h"]) if entry.get("volume_24h") else None,
-                    timestamp=datetime.utcnow()
-                )
-
-                db.add(new_price)
-                stored_count += 1
-
+                rows.append({
+                    "exchange": exchange_name,
+                    "symbol": symbol,
+                    "price": float(price),
+                    "volume_24h": float(entry["volume_24h"]) if entry.get("volume_24h") else None,
+                    "timestamp": timestamp
+                })
+
+            # Core executemany INSERT; bypasses the ORM bulk-mapping layer
+            if rows:
+                db.execute(SpotPrice.__table__.insert(), rows)
             db.commit()
-            return stored_count
+            return len(rows)
 
         except Exception as e:
             logger.error(f"[{exchange_name}] Error storing prices: {e}")
@@ -50,6 +50,10 @@ class Settings:
     ENABLE_DEX_MONITORING: bool = os.getenv("ENABLE_DEX_MONITORING", "true").lower() == "true"
     ENABLE_LIGHTER_MONITORING: bool = os.getenv("ENABLE_LIGHTER_MONITORING", "true").lower() == "true"
 
+    # Database maintenance: full VACUUM after each downsample (rewrites the
+    # whole file); by default freed pages are released incrementally
+    FULL_VACUUM_ON_DOWNSAMPLE: bool = os.getenv("FULL_VACUUM_ON_DOWNSAMPLE", "false").lower() == "true"
+
     # Position monitoring
     JLP_AMOUNT: float = float(os.getenv("JLP_AMOUNT", "0"))
 
@@ -44,6 +44,9 @@ class StartupManager:
         # Start background services
         await self._start_background_services()
 
+        # Release monitors waiting on initialization
+        BaseMonitor.ready_event.set()
+
         # Print startup info
         self._print_startup_info()
 
@@ -136,6 +139,20 @@ class StartupManager:
         except Exception as e:
             logger.debug(f"Migration note: {e}")
 
+        # Add composite (exchange, symbol, timestamp) index to funding_rates
+        # (create_tables() only adds indexes when it creates the table)
+        try:
+            conn = sqlite3.connect(settings.DATABASE_PATH)
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS ix_funding_rates_exchange_symbol_timestamp
+                ON funding_rates(exchange, symbol, timestamp)
+            """)
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Migration note: {e}")
+
     def _create_initial_users(self) -> None:
         """Create initial user if no users exist."""
         db = get_db_session()
@@ -217,6 +234,10 @@ class StartupManager:
         for monitor in self.monitors:
             await monitor.stop()
 
+        # Release pooled HTTP connections shared by the exchange adapters
+        from app.background_tasks.http_client import close_shared_client
+        await close_shared_client()
+
         logger.info("All background services stopped")
 
     def _print_startup_info(self) -> None:
@@ -5,7 +5,7 @@ SQLAlchemy ORM models only - Pydantic schemas are in app/schemas/
 
 import os
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Boolean
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Text, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 import hashlib
@@ -16,19 +16,37 @@ from app.core.config import settings
 os.makedirs(os.path.dirname(settings.DATABASE_PATH) if '/' in settings.DATABASE_PATH else "data", exist_ok=True)
 
 # SQLAlchemy setup with proper connection pool settings
-connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
+# SQLite: wait up to 30s for another connection's write lock instead of failing
+connect_args = {"check_same_thread": False, "timeout": 30} if settings.DATABASE_URL.startswith("sqlite") else {}
 
 # Configure connection pool
-# For SQLite: Use StaticPool to handle concurrent connections better
+# For SQLite: a regular pool, so every session (monitors write from worker
+# threads via asyncio.to_thread) holds its own connection. A single shared
+# connection would let one session's close/rollback discard another
+# thread's uncommitted INSERTs. WAL lets readers run alongside the writer.
 # For other DBs: Use larger pool size
 if settings.DATABASE_URL.startswith("sqlite"):
-    from sqlalchemy.pool import StaticPool
     engine = create_engine(
         settings.DATABASE_URL,
         connect_args=connect_args,
-        poolclass=StaticPool,  # Better for SQLite with many concurrent reads
+        pool_size=10,
+        max_overflow=20,
         echo=False
     )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so readers don't block on writers; NORMAL sync is durable under WAL.
+
+        Temp B-trees (GROUP BY, IN-lists in downsample DELETEs) stay in memory.
+        """
+        cursor = dbapi_connection.cursor()
+        # Only takes effect on new databases or after the next VACUUM
+        cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
 else:
     engine = create_engine(
         settings.DATABASE_URL,
@@ -158,6 +176,10 @@ class FundingRate(Base):
     """Database model for funding rate data from various exchanges."""
 
     __tablename__ = "funding_rates"
+    __table_args__ = (
+        # Per-pair time-range scans (downsampling, history queries)
+        Index("ix_funding_rates_exchange_symbol_timestamp", "exchange", "symbol", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     exchange = Column(String, nullable=False, index=True)  # lighter, aster, grvt, backpack
@@ -15,6 +15,10 @@ logger = get_logger(__name__)
 
 DEFAULT_API_TOKEN = "azGDORePK8gMaC0QOYAMyEEuzJnyUi"  # Default app token
 
+# One pooled session for all sends, so alerts fanned out to several
+# users reuse the TLS connection instead of handshaking per message
+_session = requests.Session()
+
 # Alert level priority (higher number = more important)
 ALERT_LEVEL_PRIORITY = {
     'low': 0,
@@ -116,7 +120,7 @@ def send_pushover_notification(
     logger.debug(f"[Pushover] Payload: {payload}")
 
     try:
-        response = requests.post(
+        response = _session.post(
             'https://api.pushover.net/1/messages.json',
             data=payload,
             timeout=10
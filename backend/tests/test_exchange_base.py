@@ -0,0 +1,26 @@
+"""Tests for the shared exchange adapter helpers."""
+from datetime import datetime
+
+from app.background_tasks.exchanges.base import BaseExchangeAdapter
+
+FUNDING_TIME_MS = 1700000000000
+
+
+def test_parse_ms_timestamp_accepts_int_float_and_digit_string():
+    expected = datetime.fromtimestamp(FUNDING_TIME_MS / 1000)
+
+    assert BaseExchangeAdapter.parse_ms_timestamp(FUNDING_TIME_MS) == expected
+    assert BaseExchangeAdapter.parse_ms_timestamp(float(FUNDING_TIME_MS)) == expected
+    assert BaseExchangeAdapter.parse_ms_timestamp(str(FUNDING_TIME_MS)) == expected
+
+
+def test_parse_ms_timestamp_rejects_bool():
+    assert BaseExchangeAdapter.parse_ms_timestamp(True) is None
+    assert BaseExchangeAdapter.parse_ms_timestamp(False) is None
+
+
+def test_parse_ms_timestamp_rejects_missing_and_malformed():
+    assert BaseExchangeAdapter.parse_ms_timestamp(None) is None
+    assert BaseExchangeAdapter.parse_ms_timestamp(0) is None
+    assert BaseExchangeAdapter.parse_ms_timestamp("") is None
+    assert BaseExchangeAdapter.parse_ms_timestamp("not-a-time") is None